@@ -16,6 +16,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse
 
 from ..application.project_processor import ProjectProcessor, ProjectProcessorError
 from .schemas import (
@@ -28,7 +29,8 @@ from .schemas import (
 
 logger = logging.getLogger("bim.api")
 
-router = APIRouter()
+# QTO results carry every element and WBS row; serialize them with orjson.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Singleton processor — shared across requests
 _processor: Optional[ProjectProcessor] = None
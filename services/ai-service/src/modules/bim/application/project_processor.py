@@ -35,7 +35,7 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingJob:
     """Tracks the state of a QTO processing job."""
 
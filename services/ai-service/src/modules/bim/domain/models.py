@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -65,10 +66,10 @@ class ElementType(str, Enum):
     @classmethod
     def from_ifc_class(cls, ifc_class: str) -> ElementType:
         """Resolve an IFC class name to an ElementType enum member."""
-        for member in cls:
-            if member.value == ifc_class:
-                return member
-        return cls.UNKNOWN
+        return _IFC_CLASS_MAP.get(ifc_class, cls.UNKNOWN)
+
+
+_IFC_CLASS_MAP: dict[str, ElementType] = {m.value: m for m in ElementType}
 
 
 class ClassificationConfidence(str, Enum):
@@ -247,6 +248,17 @@ UNIT_CONVERSIONS: dict[str, tuple[str, float]] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _resolve_unit_conversion(raw_unit: str) -> Optional[tuple[str, float]]:
+    """Resolve a raw IFC unit label to its (canonical_unit, factor) pair.
+
+    IFC models use a handful of distinct unit labels across thousands of
+    quantities, so the key normalization is cached per raw label.
+    """
+    key = raw_unit.strip().upper().replace(" ", "_")
+    return UNIT_CONVERSIONS.get(key)
+
+
 def normalize_unit(value: float, raw_unit: str) -> tuple[float, str]:
     """Normalize a value+unit pair to SI units.
 
@@ -254,8 +266,8 @@ def normalize_unit(value: float, raw_unit: str) -> tuple[float, str]:
         Tuple of (normalized_value, canonical_unit).
         If the unit is unknown, returns the value unchanged with the raw unit.
     """
-    key = raw_unit.strip().upper().replace(" ", "_")
-    if key in UNIT_CONVERSIONS:
-        canonical_unit, factor = UNIT_CONVERSIONS[key]
-        return value * factor, canonical_unit
-    return value, raw_unit
+    conversion = _resolve_unit_conversion(raw_unit)
+    if conversion is None:
+        return value, raw_unit
+    canonical_unit, factor = conversion
+    return value * factor, canonical_unit
@@ -104,31 +104,26 @@ class BOQFormatter:
         """Build detailed statistics about extraction quality."""
         source_counts: dict[str, int] = defaultdict(int)
         confidence_counts: dict[str, int] = defaultdict(int)
+        materials: set[str] = set()
+        storeys: set[str] = set()
+        uniclass_codes: set[str] = set()
         material_count = 0
         storey_count = 0
 
+        # Single pass over the elements; large IFC models hold 100k+ of them.
         for elem in elements:
             if elem.material:
                 material_count += 1
+                materials.add(elem.material)
             if elem.storey:
                 storey_count += 1
+                storeys.add(elem.storey)
             if elem.classification:
                 confidence_counts[elem.classification.confidence.value] += 1
+                uniclass_codes.add(elem.classification.uniclass_code)
             for q in elem.quantities:
                 source_counts[q.source.value] += 1
 
-        unique_materials = len({
-            elem.material for elem in elements if elem.material
-        })
-        unique_storeys = len({
-            elem.storey for elem in elements if elem.storey
-        })
-        unique_classifications = len({
-            elem.classification.uniclass_code
-            for elem in elements
-            if elem.classification
-        })
-
         return {
             "quantity_sources": dict(source_counts),
             "classification_confidence": dict(confidence_counts),
@@ -138,7 +133,7 @@ class BOQFormatter:
             "storey_coverage": round(
                 storey_count / len(elements) * 100, 1
             ) if elements else 0.0,
-            "unique_materials": unique_materials,
-            "unique_storeys": unique_storeys,
-            "unique_classifications": unique_classifications,
+            "unique_materials": len(materials),
+            "unique_storeys": len(storeys),
+            "unique_classifications": len(uniclass_codes),
         }
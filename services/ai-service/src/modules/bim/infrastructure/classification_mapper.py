@@ -12,9 +12,12 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from ..domain.models import Classification, ClassificationConfidence, Element
 
 logger = logging.getLogger("bim.classification_mapper")
@@ -24,6 +27,17 @@ class ClassificationMapperError(Exception):
     """Raised when classification mapping fails."""
 
 
+@lru_cache(maxsize=8)
+def _read_mapping_file(path: str, mtime_ns: int) -> dict:
+    """Parse a mapping file, cached by path and modification time.
+
+    Every processing job builds a new mapper, so the JSON is decoded once
+    and reused until the file on disk changes.
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 class ClassificationMapper:
     """Maps IFC elements to Uniclass and OmniClass codes."""
 
@@ -47,8 +61,9 @@ class ClassificationMapper:
             return
 
         try:
-            with open(self._mapping_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_mapping_file(
+                str(self._mapping_file), self._mapping_file.stat().st_mtime_ns
+            )
 
             self._mapping = data.get("mappings", {})
             self._descriptions = data.get("descriptions", {})
@@ -106,6 +106,7 @@ class QuantityExtractor:
     def __init__(self, model: ifcopenshell.file) -> None:
         self._model = model
         self._unit_map = self._build_unit_map()
+        self._psets_by_element = self._build_property_set_index()
 
     def extract_quantities(self, element: Element, ifc_elem: ifcopenshell.entity_instance) -> list[Quantity]:
         """Extract all available quantities for an element.
@@ -385,18 +386,25 @@ class QuantityExtractor:
         self, ifc_elem: ifcopenshell.entity_instance
     ) -> dict[str, ifcopenshell.entity_instance]:
         """Get all property sets / quantity sets defined on an element."""
-        psets: dict[str, ifcopenshell.entity_instance] = {}
+        return self._psets_by_element.get(ifc_elem.id(), {})
+
+    def _build_property_set_index(self) -> dict[int, dict[str, ifcopenshell.entity_instance]]:
+        """Index property sets by element id in a single pass over the model.
+
+        Avoids rescanning every IfcRelDefinesByProperties for each element,
+        which made extraction quadratic on large models.
+        """
+        index: dict[int, dict[str, ifcopenshell.entity_instance]] = {}
 
         for rel in self._model.by_type("IfcRelDefinesByProperties"):
-            if ifc_elem not in rel.RelatedObjects:
-                continue
             prop_def = rel.RelatingPropertyDefinition
             if prop_def is None:
                 continue
             name = getattr(prop_def, "Name", None) or str(prop_def.id())
-            psets[name] = prop_def
+            for obj in rel.RelatedObjects:
+                index.setdefault(obj.id(), {})[name] = prop_def
 
-        return psets
+        return index
 
     def _build_unit_map(self) -> dict[str, str]:
         """Build a map of IFC unit types to unit names from the project."""
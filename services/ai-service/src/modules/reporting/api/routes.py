@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, HTTPException
 
 from ..core.generator import ReportGenerator
@@ -111,19 +112,17 @@ async def download_report(report_id: str) -> dict:
     if not entry:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, ORJSONResponse
 
     fmt = entry["metadata"].get("format", "html")
     content = entry["content"]
 
     if fmt == "json":
-        import json
-
         try:
-            parsed = json.loads(content)
-            return JSONResponse(content=parsed)
-        except (json.JSONDecodeError, TypeError):
-            return JSONResponse(content={"raw": content})
+            parsed = orjson.loads(content)
+            return ORJSONResponse(content=parsed)
+        except (orjson.JSONDecodeError, TypeError):
+            return ORJSONResponse(content={"raw": content})
     else:
         return HTMLResponse(content=content)
 
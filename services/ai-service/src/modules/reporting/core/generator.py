@@ -10,12 +10,16 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import markdown
+import orjson
 from jinja2 import Environment, FileSystemLoader
 
 from ..models.schemas import (
@@ -33,6 +37,50 @@ logger = logging.getLogger("reporting-service")
 
 TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
 
+# Status / severity values used when filtering report items
+_HIGH_SEV = frozenset({"high", "critical"})
+_BEHIND = frozenset({"behind", "delayed", "critical"})
+_AT_RISK = frozenset({"delayed", "at_risk"})
+_UPCOMING = frozenset({"planned", "ready"})
+
+_ITEMGETTER_1 = itemgetter(1)
+
+# Recommendation templates (filled with str.format)
+_REC_PPC_BELOW_TARGET = (
+    "PPC is at {ppc}, below the 80% target. "
+    "Conduct a root cause analysis of incomplete commitments in the weekly planning meeting."
+)
+_REC_HIGH_CONSTRAINTS = (
+    "{n} high/critical constraint(s) require immediate attention. "
+    "Escalate to project leadership for resolution."
+)
+_REC_TRADES_BEHIND = (
+    "Trades behind schedule: {names}. "
+    "Review crew sizing and consider acceleration measures."
+)
+_REC_LOW_PLAN_RELIABILITY = (
+    "Plan reliability (PPC: {ppc}) is significantly below target. "
+    "A structured improvement programme is recommended."
+)
+_REC_HIGH_SEVERITY_RISKS = (
+    "{n} high-severity risk(s) identified. "
+    "Senior leadership review required."
+)
+_REC_MILESTONES_AT_RISK = "At-risk milestones: {names}. Recovery plans should be developed."
+_REC_ACTIVITIES_BEHIND = (
+    "{n} activity/ies are behind schedule. "
+    "Prioritise recovery actions for the most critical items."
+)
+_REC_TOP_ROOT_CAUSE = (
+    "Most frequent root cause: '{cause}' ({count} occurrences). "
+    "Implement targeted countermeasures for this category."
+)
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 # ── Optional Gemini import ──
 _gemini_model = None
 
@@ -61,6 +109,31 @@ def _has_gemini() -> bool:
     return _gemini_model is not None
 
 
+class RenderedSection(NamedTuple):
+    """A report section with its markdown body converted to HTML.
+
+    ``ReportSection.data`` is not carried over: base.html only renders the
+    title and content, and the structured data is already exposed through
+    the JSON report format.
+    """
+
+    title: str
+    content: str
+
+
+# Markdown instances are not thread-safe but are costly to build, so each
+# thread keeps its own and resets it between conversions.
+_md_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    md = getattr(_md_local, "md", None)
+    if md is None:
+        md = markdown.Markdown(extensions=["tables", "fenced_code"])
+        _md_local.md = md
+    return md
+
+
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
@@ -83,6 +156,21 @@ def _fmt_date(value: str | None) -> str:
         return str(value)
 
 
+def _fmt_iso(value: date | str | None) -> str | None:
+    """Render a date/datetime as ISO 8601; strings pass through unchanged."""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+@lru_cache(maxsize=256)
+def _title_key(key: str) -> str:
+    """Turn a snake_case data key into a display label."""
+    return key.replace("_", " ").title()
+
+
 def _safe_get(data: dict, *keys, default=None):
     """Safely traverse nested dicts."""
     current = data
@@ -107,9 +195,11 @@ class ReportGenerator:
     """
 
     def __init__(self) -> None:
+        # Templates ship with the service, so skip the per-render mtime check.
         self._jinja = Environment(
             loader=FileSystemLoader(str(TEMPLATES_DIR)),
             autoescape=True,
+            auto_reload=False,
         )
 
     # ------------------------------------------------------------------
@@ -142,9 +232,9 @@ class ReportGenerator:
         if request.format == ReportFormat.json:
             # Return the structured content as JSON — content field holds the
             # JSON-serialised ReportContent so callers can parse it.
-            import json
-
-            html_content = json.dumps(report_content.model_dump(), default=str, indent=2)
+            html_content = orjson.dumps(
+                report_content.model_dump(), default=str, option=orjson.OPT_INDENT_2
+            ).decode()
         else:
             html_content = self._render_html(
                 title=title,
@@ -290,7 +380,7 @@ class ReportGenerator:
         ))
 
         # 5. Lookahead
-        upcoming = [a for a in activities if _safe_get(a, "status") in ("planned", "ready")][:10]
+        upcoming = [a for a in activities if _safe_get(a, "status") in _UPCOMING][:10]
         lookahead_rows: list[str] = []
         for a in upcoming:
             name = _safe_get(a, "name", default="Unknown")
@@ -410,7 +500,7 @@ class ReportGenerator:
 
         # 4. Risk Assessment
         open_constraints = [c for c in constraints if _safe_get(c, "status") != "resolved"]
-        high_severity = [c for c in open_constraints if _safe_get(c, "severity") in ("high", "critical")]
+        high_severity = [c for c in open_constraints if _safe_get(c, "severity") in _HIGH_SEV]
         risk_data = {
             "total_open": len(open_constraints),
             "high_severity": len(high_severity),
@@ -682,7 +772,7 @@ class ReportGenerator:
 
         parts: list[str] = []
         for key, value in data.items():
-            label = key.replace("_", " ").title()
+            label = _title_key(key)
             if isinstance(value, float):
                 parts.append(f"**{label}:** {value:.1f}")
             elif isinstance(value, (int, str)):
@@ -697,10 +787,9 @@ class ReportGenerator:
         """Format a dict as a readable string for inclusion in an LLM prompt."""
         lines: list[str] = []
         for key, value in data.items():
-            label = key.replace("_", " ").title()
+            label = _title_key(key)
             if isinstance(value, (list, dict)):
-                import json
-                lines.append(f"- {label}: {json.dumps(value, default=str)}")
+                lines.append(f"- {label}: {orjson.dumps(value, default=str).decode()}")
             else:
                 lines.append(f"- {label}: {value}")
         return "\n".join(lines)
@@ -717,29 +806,29 @@ class ReportGenerator:
     ) -> list[str]:
         recs: list[str] = []
         if ppc is not None and ppc < 80:
-            recs.append(
-                f"PPC is at {_fmt_pct(ppc)}, below the 80% target. "
-                "Conduct a root cause analysis of incomplete commitments in the weekly planning meeting."
-            )
+            recs.append(_REC_PPC_BELOW_TARGET.format(ppc=_fmt_pct(ppc)))
         if ppc is not None and ppc < 60:
             recs.append(
                 "PPC is critically low. Consider a constraint removal blitz and rebaseline the lookahead plan."
             )
 
-        high_constraints = [c for c in open_constraints if _safe_get(c, "severity") in ("high", "critical")]
-        if high_constraints:
-            recs.append(
-                f"{len(high_constraints)} high/critical constraint(s) require immediate attention. "
-                "Escalate to project leadership for resolution."
-            )
-
-        behind_trades = [t for t in trades if _safe_get(t, "status") in ("behind", "delayed", "critical")]
-        if behind_trades:
-            names = ", ".join([_safe_get(t, "name", default="Unknown") for t in behind_trades[:3]])
-            recs.append(
-                f"Trades behind schedule: {names}. "
-                "Review crew sizing and consider acceleration measures."
-            )
+        # Items are plain dicts from the request payload; read fields directly
+        # and skip anything else rather than routing each probe via _safe_get.
+        high_count = 0
+        for c in open_constraints:
+            if isinstance(c, dict) and c.get("severity") in _HIGH_SEV:
+                high_count += 1
+        if high_count:
+            recs.append(_REC_HIGH_CONSTRAINTS.format(n=high_count))
+
+        behind_names: list[str] = []
+        for t in trades:
+            if isinstance(t, dict) and t.get("status") in _BEHIND:
+                behind_names.append(t.get("name", "Unknown"))
+                if len(behind_names) == 3:
+                    break
+        if behind_names:
+            recs.append(_REC_TRADES_BEHIND.format(names=", ".join(behind_names)))
 
         if not recs:
             recs.append("Project is performing within acceptable parameters. Continue current monitoring cadence.")
@@ -756,24 +845,19 @@ class ReportGenerator:
         recs: list[str] = []
 
         if ppc is not None and ppc < 70:
-            recs.append(
-                f"Plan reliability (PPC: {_fmt_pct(ppc)}) is significantly below target. "
-                "A structured improvement programme is recommended."
-            )
+            recs.append(_REC_LOW_PLAN_RELIABILITY.format(ppc=_fmt_pct(ppc)))
 
         if high_severity_constraints:
-            recs.append(
-                f"{len(high_severity_constraints)} high-severity risk(s) identified. "
-                "Senior leadership review required."
-            )
+            recs.append(_REC_HIGH_SEVERITY_RISKS.format(n=len(high_severity_constraints)))
 
-        delayed_milestones = [
-            m for m in milestones
-            if _safe_get(m, "status") in ("delayed", "at_risk")
-        ]
-        if delayed_milestones:
-            names = ", ".join([_safe_get(m, "name", default="Unknown") for m in delayed_milestones[:3]])
-            recs.append(f"At-risk milestones: {names}. Recovery plans should be developed.")
+        delayed_names: list[str] = []
+        for m in milestones:
+            if isinstance(m, dict) and m.get("status") in _AT_RISK:
+                delayed_names.append(m.get("name", "Unknown"))
+                if len(delayed_names) == 3:
+                    break
+        if delayed_names:
+            recs.append(_REC_MILESTONES_AT_RISK.format(names=", ".join(delayed_names)))
 
         if not recs:
             recs.append("Project is on track. Maintain current management approach.")
@@ -789,17 +873,11 @@ class ReportGenerator:
         recs: list[str] = []
 
         if behind_items:
-            recs.append(
-                f"{len(behind_items)} activity/ies are behind schedule. "
-                "Prioritise recovery actions for the most critical items."
-            )
+            recs.append(_REC_ACTIVITIES_BEHIND.format(n=len(behind_items)))
 
         if root_causes:
-            top_cause = max(root_causes, key=root_causes.get)  # type: ignore[arg-type]
-            recs.append(
-                f"Most frequent root cause: '{top_cause}' ({root_causes[top_cause]} occurrences). "
-                "Implement targeted countermeasures for this category."
-            )
+            top_cause, top_count = max(root_causes.items(), key=_ITEMGETTER_1)
+            recs.append(_REC_TOP_ROOT_CAUSE.format(cause=top_cause, count=top_count))
 
         if ppc is not None and ppc < 70:
             recs.append(
@@ -820,34 +898,35 @@ class ReportGenerator:
         self,
         title: str,
         project_id: str,
-        date_range_start: Optional[object],
-        date_range_end: Optional[object],
+        date_range_start: date | str | None,
+        date_range_end: date | str | None,
         sections: list[ReportSection],
         summary: str,
         recommendations: list[str],
         report_type: str,
     ) -> str:
         """Render the full HTML report using the Jinja2 base template."""
-        md = markdown.Markdown(extensions=["tables", "fenced_code"])
+        md = _get_markdown()
+        now = datetime.utcnow()
+        generated_at = (
+            f"{now.day:02d} {_MONTHS[now.month - 1]} {now.year}, "
+            f"{now.hour:02d}:{now.minute:02d} UTC"
+        )
 
-        rendered_sections = []
+        rendered_sections: list[RenderedSection] = []
         for section in sections:
             html_content = md.convert(section.content)
             md.reset()
-            rendered_sections.append({
-                "title": section.title,
-                "content": html_content,
-                "data": section.data,
-            })
+            rendered_sections.append(RenderedSection(section.title, html_content))
 
         template = self._jinja.get_template("base.html")
         return template.render(
             title=title,
             project_id=project_id,
             report_type=report_type.replace("_", " ").title(),
-            generated_at=datetime.utcnow().strftime("%d %B %Y, %H:%M UTC"),
-            date_range_start=str(date_range_start) if date_range_start else None,
-            date_range_end=str(date_range_end) if date_range_end else None,
+            generated_at=generated_at,
+            date_range_start=_fmt_iso(date_range_start),
+            date_range_end=_fmt_iso(date_range_end),
             sections=rendered_sections,
             summary=summary,
             recommendations=recommendations,
@@ -869,11 +948,10 @@ class ReportGenerator:
 
     @staticmethod
     def _format_dict_as_table(data: dict) -> str:
-        rows = [f"| {k.replace('_', ' ').title()} | {v} |" for k, v in data.items()]
         return (
             "| Field | Value |\n"
             "| --- | --- |\n"
-            + "\n".join(rows)
+            + "\n".join(f"| {_title_key(k)} | {v} |" for k, v in data.items())
         )
 
     @staticmethod
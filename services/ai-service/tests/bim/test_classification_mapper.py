@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -169,3 +170,18 @@ class TestClassificationMapper:
         types = mapper.supported_entity_types
         assert "IfcWall" in types
         assert "IfcSlab" in types
+
+    def test_mapping_reused_until_file_changes(self, mapping_file: Path) -> None:
+        first = ClassificationMapper(mapping_file)
+        second = ClassificationMapper(mapping_file)
+        assert first.supported_entity_types == second.supported_entity_types
+
+        mapping_file.write_text(
+            json.dumps({"mappings": {"IfcBeam": {}}, "descriptions": {}}),
+            encoding="utf-8",
+        )
+        stat = mapping_file.stat()
+        os.utime(mapping_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = ClassificationMapper(mapping_file)
+        assert reloaded.supported_entity_types == ["IfcBeam"]
@@ -219,3 +219,8 @@ class TestNormalizeUnit:
         val, unit = normalize_unit(1.0, "FOOT")
         assert unit == "m"
         assert abs(val - 0.3048) < 1e-4
+
+    def test_space_separated_unit(self) -> None:
+        val, unit = normalize_unit(2.0, " square foot ")
+        assert unit == "m2"
+        assert abs(val - 0.185806) < 1e-4
@@ -7,12 +7,21 @@ and outcome feedback (for ML training data collection).
 All outputs are recommendations — no direct plan changes.
 """
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import TypeVar
+
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from app.models.risk import (
     AssessmentOutcomeInput,
     AssessmentOutcomeResult,
     AssessProjectRequest,
+    DelayImpact,
     RiskAssessmentResult,
     RiskExplanation,
     RiskImpactResult,
@@ -23,23 +32,157 @@ from app.services.data_fetcher import (
     fetch_project_activities,
     fetch_project_context,
 )
+from app.services.ids import new_id
 from app.services.rule_engine import DEFAULT_RULES, RuleBasedRiskEngine
 
 router = APIRouter(prefix="/risk-engine", tags=["AI Risk Engine"])
 
-# In-memory storage for assessments (will move to DB in production)
-_assessments: dict[str, RiskAssessmentResult] = {}
-_outcomes: dict[str, AssessmentOutcomeResult] = {}
+_UTC = timezone.utc
 
-# Engine instance (rules can be customized per project)
+# In-memory storage for assessments (will move to DB in production)
+# Bounded LRU so long-running pods do not grow without limit
+MAX_STORED_RECORDS = 10_000
+_assessments: OrderedDict[str, RiskAssessmentResult] = OrderedDict()
+_outcomes: OrderedDict[str, AssessmentOutcomeResult] = OrderedDict()
+# Explanations are pure functions of immutable assessments
+_explanations: OrderedDict[str, RiskExplanation] = OrderedDict()
+
+_V = TypeVar("_V")
+
+
+def _lru_get(store: OrderedDict[str, _V], key: str) -> _V | None:
+    """Get a stored record and mark it as recently used."""
+    value = store.get(key)
+    if value is not None:
+        store.move_to_end(key)
+    return value
+
+
+def _lru_put(store: OrderedDict[str, _V], key: str, value: _V) -> None:
+    """Store a record, evicting the least recently used beyond the cap."""
+    store[key] = value
+    store.move_to_end(key)
+    while len(store) > MAX_STORED_RECORDS:
+        store.popitem(last=False)
+
+
+# Outcome writes are coalesced by a background writer (see run_outcome_writer)
+# so a DB-backed sink can insert whole batches in one round-trip.
+OUTCOME_BATCH_SIZE = 100
+OUTCOME_FLUSH_SECONDS = 1.0
+_outcome_queue: asyncio.Queue[AssessmentOutcomeResult] | None = None
+
+
+def _store_outcomes(batch: list[AssessmentOutcomeResult]) -> None:
+    """Batch-insert sink for outcomes (in-memory until DB persistence lands)."""
+    for result in batch:
+        _lru_put(_outcomes, result.id, result)
+
+
+async def run_outcome_writer() -> None:
+    """Drain queued outcomes in batches until cancelled.
+
+    A batch is flushed once it holds OUTCOME_BATCH_SIZE items or
+    OUTCOME_FLUSH_SECONDS after its first item arrived. Pending outcomes
+    are flushed on shutdown.
+    """
+    global _outcome_queue
+    queue = _outcome_queue = asyncio.Queue()
+    batch: list[AssessmentOutcomeResult] = []
+    try:
+        while True:
+            batch.append(await queue.get())
+            try:
+                async with asyncio.timeout(OUTCOME_FLUSH_SECONDS):
+                    while len(batch) < OUTCOME_BATCH_SIZE:
+                        batch.append(await queue.get())
+            except TimeoutError:
+                pass
+            _store_outcomes(batch)
+            batch = []
+    finally:
+        _outcome_queue = None
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        _store_outcomes(batch)
+
+
+# Engine instances (rules can be customized per project)
 _project_engines: dict[str, RuleBasedRiskEngine] = {}
 
+# Shared engine for projects without custom rules; assess() is stateless
+_DEFAULT_ENGINE = RuleBasedRiskEngine()
+
+# Assessments over more activities than this run in a worker thread
+OFFLOAD_ASSESS_THRESHOLD = 2_000
+
 
 def _get_engine(project_id: str | None = None) -> RuleBasedRiskEngine:
     """Get engine instance, with project-specific rules if available."""
-    if project_id and project_id in _project_engines:
-        return _project_engines[project_id]
-    return RuleBasedRiskEngine()
+    if project_id:
+        return _project_engines.get(project_id, _DEFAULT_ENGINE)
+    return _DEFAULT_ENGINE
+
+
+def _build_dependency_index(
+    activities: list[dict],
+) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """Index activity positions by predecessor id and by trade.
+
+    Only activities with predecessors are indexed, matching the cascade
+    rule used by impact analysis.
+    """
+    deps_by_pred: dict[str, list[int]] = {}
+    by_trade: dict[str, list[int]] = {}
+    for i, a in enumerate(activities):
+        predecessors = a.get("predecessors", [])
+        if not predecessors:
+            continue
+        for pred in predecessors:
+            deps_by_pred.setdefault(pred.get("id"), []).append(i)
+        by_trade.setdefault(a.get("trade_id"), []).append(i)
+    return deps_by_pred, by_trade
+
+
+# Impact responses with more affected activities than this are streamed
+STREAM_IMPACT_THRESHOLD = 500
+_STREAM_CHUNK_SIZE = 256
+_AFFECTED_PLACEHOLDER = b'"affectedActivities":[]'
+
+
+def _delay_impact(activity: dict, delay_days: int) -> DelayImpact:
+    return DelayImpact(
+        activityId=activity["id"],
+        activityName=f"{activity.get('trade_name', '')} @ {activity.get('location_name', '')}",
+        delayDays=delay_days,
+        isCritical=activity.get("is_critical", False),
+    )
+
+
+def _iter_impact_json(
+    envelope: RiskImpactResult,
+    affected: Iterator[dict],
+    delay_days: int,
+) -> Iterator[bytes]:
+    """Yield the JSON of an impact result, building affected entries lazily.
+
+    ``envelope`` carries every field except the (empty) affected list; the
+    affected activities are serialized in chunks as they are produced.
+    """
+    body = orjson.dumps(envelope.model_dump(mode="json", by_alias=True))
+    head, tail = body.split(_AFFECTED_PLACEHOLDER, 1)
+    yield head + b'"affectedActivities":['
+    chunk: list[bytes] = []
+    first = True
+    for activity in affected:
+        impact = _delay_impact(activity, delay_days)
+        chunk.append(orjson.dumps(impact.model_dump(mode="json", by_alias=True)))
+        if len(chunk) == _STREAM_CHUNK_SIZE:
+            yield (b"" if first else b",") + b",".join(chunk)
+            chunk, first = [], False
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]" + tail
 
 
 # ── Risk Assessment ──
@@ -60,21 +203,29 @@ async def assess_project_risk(
     request: AssessProjectRequest | None = None,
     user_id: str | None = Query(None, alias="userId"),
 ) -> RiskAssessmentResult:
-    # Fetch project data from core-service
-    activities = await fetch_project_activities(project_id, user_id)
-    context = await fetch_project_context(project_id, user_id)
+    # Fetch project data from core-service (independent calls, run concurrently)
+    activities, context = await asyncio.gather(
+        fetch_project_activities(project_id, user_id),
+        fetch_project_context(project_id, user_id),
+    )
 
     # Filter to specific activities if requested
     if request and request.activity_ids:
-        activities = [
-            a for a in activities if a.get("id") in request.activity_ids
-        ]
+        wanted = set(request.activity_ids)
+        activities = [a for a in activities if a.get("id") in wanted]
 
     engine = _get_engine(project_id)
-    result = engine.assess(project_id, activities, context)
+    if len(activities) > OFFLOAD_ASSESS_THRESHOLD:
+        # Large projects: score off the event loop so other requests proceed
+        result = await asyncio.to_thread(
+            engine.assess, project_id, activities, context
+        )
+    else:
+        result = engine.assess(project_id, activities, context)
 
     # Store for later reference / feedback
-    _assessments[result.id] = result
+    _lru_put(_assessments, result.id, result)
+    _explanations.pop(result.id, None)
 
     return result
 
@@ -96,7 +247,7 @@ async def analyze_delay_impact(
     delay_days: int = Query(..., ge=1, le=365),
     project_id: str = Query(..., alias="projectId"),
     user_id: str | None = Query(None, alias="userId"),
-) -> RiskImpactResult:
+) -> RiskImpactResult | StreamingResponse:
     # Basic impact analysis (will be enhanced with CPM graph traversal)
     activities = await fetch_project_activities(project_id, user_id)
 
@@ -106,29 +257,52 @@ async def analyze_delay_impact(
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Simple cascade analysis: find activities that depend on this one
+    # (listed as a predecessor) or share its trade. Index both relations in
+    # one pass instead of scanning every predecessor list per activity.
     # In production, this uses full CPM forward/backward pass
-    affected = []
-    for a in activities:
-        for pred in a.get("predecessors", []):
-            if pred.get("id") == activity_id or a.get("trade_id") == source.get("trade_id"):
-                from app.models.risk import DelayImpact
-
-                affected.append(
-                    DelayImpact(
-                        activityId=a["id"],
-                        activityName=f"{a.get('trade_name', '')} @ {a.get('location_name', '')}",
-                        delayDays=delay_days,
-                        isCritical=a.get("is_critical", False),
-                    )
-                )
-                break
+    deps_by_pred, by_trade = _build_dependency_index(activities)
+    dependents = deps_by_pred.get(activity_id, ())
+    trade_mates = by_trade.get(source.get("trade_id"), ())
+    is_critical = source.get("is_critical", False)
+
+    # Leaf activity: nothing downstream to build
+    if not dependents and not trade_mates:
+        return RiskImpactResult(
+            sourceActivityId=activity_id,
+            delayDays=delay_days,
+            affectedActivities=[],
+            totalProjectDelay=delay_days if is_critical else 0,
+            affectedCriticalPath=is_critical,
+        )
+
+    # The set dedupes activities matched by both relations; sorting keeps
+    # the original activity order.
+    affected_idx = sorted({*dependents, *trade_mates})
+
+    # Large cascades are streamed so the response is never fully buffered
+    if len(affected_idx) > STREAM_IMPACT_THRESHOLD:
+        envelope = RiskImpactResult(
+            sourceActivityId=activity_id,
+            delayDays=delay_days,
+            affectedActivities=[],
+            totalProjectDelay=delay_days if is_critical else 0,
+            affectedCriticalPath=is_critical,
+        )
+        return StreamingResponse(
+            _iter_impact_json(
+                envelope, (activities[i] for i in affected_idx), delay_days
+            ),
+            media_type="application/json",
+        )
 
     return RiskImpactResult(
         sourceActivityId=activity_id,
         delayDays=delay_days,
-        affectedActivities=affected,
-        totalProjectDelay=delay_days if source.get("is_critical") else 0,
-        affectedCriticalPath=source.get("is_critical", False),
+        affectedActivities=[
+            _delay_impact(activities[i], delay_days) for i in affected_idx
+        ],
+        totalProjectDelay=delay_days if is_critical else 0,
+        affectedCriticalPath=is_critical,
     )
 
 
@@ -142,7 +316,11 @@ async def analyze_delay_impact(
     description="Explainable output: which rules triggered, weights, reasoning.",
 )
 async def get_risk_explanation(assessment_id: str) -> RiskExplanation:
-    assessment = _assessments.get(assessment_id)
+    cached = _lru_get(_explanations, assessment_id)
+    if cached is not None:
+        return cached
+
+    assessment = _lru_get(_assessments, assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
@@ -166,7 +344,7 @@ async def get_risk_explanation(assessment_id: str) -> RiskExplanation:
         )
     limitations.append("Rule-based engine (Stage 1) — no ML model available yet")
 
-    return RiskExplanation(
+    explanation = RiskExplanation(
         summary=summary,
         factors=assessment.factors,
         confidence=assessment.confidence_score,
@@ -178,6 +356,8 @@ async def get_risk_explanation(assessment_id: str) -> RiskExplanation:
             "External factors (market conditions, regulatory changes) not included",
         ],
     )
+    _lru_put(_explanations, assessment_id, explanation)
+    return explanation
 
 
 # ── Rule Management ──
@@ -205,24 +385,25 @@ async def update_rule_config(
     rule_id: str,
     update: RuleUpdateRequest,
 ) -> RiskRuleConfig:
-    # Get or create project-specific engine
-    if project_id not in _project_engines:
-        _project_engines[project_id] = RuleBasedRiskEngine(
-            rules=[r.model_copy() for r in DEFAULT_RULES]
+    # Get or create project-specific engine. setdefault keeps a single
+    # engine per project even if creation ever interleaves with another
+    # request; the lookup first avoids building an engine on every PUT.
+    engine = _project_engines.get(project_id)
+    if engine is None:
+        # Shares the default rule objects; only modified rules get copied
+        engine = _project_engines.setdefault(
+            project_id, RuleBasedRiskEngine(rules=list(DEFAULT_RULES))
         )
 
-    engine = _project_engines[project_id]
-    rule = next((r for r in engine.rules if r.id == rule_id), None)
+    rule = engine.update_rule(
+        rule_id,
+        weight=update.weight,
+        risk_contribution=update.risk_contribution,
+        is_active=update.is_active,
+    )
     if not rule:
         raise HTTPException(status_code=404, detail=f"Rule {rule_id} not found")
 
-    if update.weight is not None:
-        rule.weight = update.weight
-    if update.risk_contribution is not None:
-        rule.risk_contribution = update.risk_contribution
-    if update.is_active is not None:
-        rule.is_active = update.is_active
-
     return rule
 
 
@@ -242,26 +423,27 @@ async def record_assessment_outcome(
     assessment_id: str,
     outcome: AssessmentOutcomeInput,
 ) -> AssessmentOutcomeResult:
-    assessment = _assessments.get(assessment_id)
+    assessment = _lru_get(_assessments, assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
-    import uuid
-    from datetime import datetime
-
     result = AssessmentOutcomeResult(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         assessmentId=assessment_id,
         projectId=assessment.project_id,
         predictedRisk=assessment.overall_risk,
         predictedDelayProbability=assessment.delay_probability,
         actualDelayed=outcome.actual_delayed,
         actualDelayDays=outcome.actual_delay_days,
-        outcomeDate=datetime.utcnow(),
+        outcomeDate=datetime.now(_UTC),
         notes=outcome.notes,
     )
 
-    _outcomes[result.id] = result
+    if _outcome_queue is not None:
+        _outcome_queue.put_nowait(result)
+    else:
+        # Writer not running (e.g. tests without lifespan): store directly
+        _store_outcomes([result])
     return result
 
 
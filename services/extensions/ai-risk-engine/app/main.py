@@ -9,10 +9,29 @@ Port: 8010
 Layer: Extension (Intelligence Layer)
 """
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as risk_router
+from app.api.routes import run_outcome_writer
+from app.services.data_fetcher import close_client
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the batched outcome writer and close shared clients on exit."""
+    writer = asyncio.create_task(run_outcome_writer())
+    yield
+    writer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await writer
+    await close_client()
+
 
 app = FastAPI(
     title="SmartCon360 AI Risk Engine",
@@ -24,6 +43,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/risk-engine/docs",
     openapi_url="/risk-engine/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS
@@ -30,10 +30,16 @@ class RiskCategory(str, Enum):
     SAFETY = "safety"
 
 
+class AliasedModel(BaseModel):
+    """Base for models with camelCase aliases that also accept field names."""
+
+    model_config = {"populate_by_name": True}
+
+
 # ── Rule Model ──
 
 
-class RiskRuleConfig(BaseModel):
+class RiskRuleConfig(AliasedModel):
     """Configurable risk rule definition."""
 
     id: str = Field(..., description="Rule code, e.g. R001")
@@ -59,13 +65,11 @@ class RiskRuleConfig(BaseModel):
     )
     is_active: bool = Field(True, alias="isActive")
 
-    model_config = {"populate_by_name": True}
-
 
 # ── Risk Factor (triggered rule result) ──
 
 
-class RiskFactor(BaseModel):
+class RiskFactor(AliasedModel):
     """Result of a single triggered rule."""
 
     rule_id: str = Field(..., alias="ruleId")
@@ -76,13 +80,11 @@ class RiskFactor(BaseModel):
     threshold: float
     explanation: str
 
-    model_config = {"populate_by_name": True}
-
 
 # ── Risk Assessment ──
 
 
-class RiskAssessmentResult(BaseModel):
+class RiskAssessmentResult(AliasedModel):
     """Complete risk assessment output."""
 
     id: str
@@ -108,8 +110,6 @@ class RiskAssessmentResult(BaseModel):
     requires_approval: bool = Field(True, alias="requiresApproval")
     approved_by: Optional[str] = Field(None, alias="approvedBy")
 
-    model_config = {"populate_by_name": True}
-
 
 # ── Impact Analysis ──
 
@@ -125,7 +125,7 @@ class DelayImpact(BaseModel):
     is_critical: bool = Field(False, alias="isCritical")
 
 
-class RiskImpactResult(BaseModel):
+class RiskImpactResult(AliasedModel):
     """Domino effect analysis for a specific delay."""
 
     source_activity_id: str = Field(..., alias="sourceActivityId")
@@ -139,23 +139,19 @@ class RiskImpactResult(BaseModel):
         None, alias="costImpactEstimate"
     )
 
-    model_config = {"populate_by_name": True}
-
 
 # ── Assessment Outcome (for ML training data) ──
 
 
-class AssessmentOutcomeInput(BaseModel):
+class AssessmentOutcomeInput(AliasedModel):
     """Record actual outcome of a risk assessment for ML training."""
 
     actual_delayed: bool = Field(..., alias="actualDelayed")
     actual_delay_days: Optional[int] = Field(None, alias="actualDelayDays")
     notes: Optional[str] = None
 
-    model_config = {"populate_by_name": True}
-
 
-class AssessmentOutcomeResult(BaseModel):
+class AssessmentOutcomeResult(AliasedModel):
     """Stored outcome record."""
 
     id: str
@@ -170,13 +166,11 @@ class AssessmentOutcomeResult(BaseModel):
     outcome_date: datetime = Field(..., alias="outcomeDate")
     notes: Optional[str] = None
 
-    model_config = {"populate_by_name": True}
-
 
 # ── API Request/Response ──
 
 
-class AssessProjectRequest(BaseModel):
+class AssessProjectRequest(AliasedModel):
     """Request body for project risk assessment."""
 
     activity_ids: Optional[list[str]] = Field(
@@ -185,10 +179,8 @@ class AssessProjectRequest(BaseModel):
         description="Specific activities to assess. If None, assess all.",
     )
 
-    model_config = {"populate_by_name": True}
 
-
-class RuleUpdateRequest(BaseModel):
+class RuleUpdateRequest(AliasedModel):
     """Request to update a rule's configuration."""
 
     weight: Optional[float] = Field(None, ge=0.0, le=1.0)
@@ -197,10 +189,8 @@ class RuleUpdateRequest(BaseModel):
     )
     is_active: Optional[bool] = Field(None, alias="isActive")
 
-    model_config = {"populate_by_name": True}
-
 
-class RiskExplanation(BaseModel):
+class RiskExplanation(AliasedModel):
     """Explainable AI output for a risk assessment."""
 
     summary: str
@@ -212,5 +202,3 @@ class RiskExplanation(BaseModel):
     alternative_interpretations: list[str] = Field(
         ..., alias="alternativeInterpretations"
     )
-
-    model_config = {"populate_by_name": True}
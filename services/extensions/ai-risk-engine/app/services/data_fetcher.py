@@ -6,14 +6,102 @@ Follows the architectural rule: extension services read from core services
 via API, not direct database access.
 """
 
+import asyncio
 import os
+import time
+from typing import Any, Awaitable, Callable
 
 import httpx
+import orjson
 
 CORE_SERVICE_URL = os.getenv("CORE_SERVICE_URL", "http://localhost:3001")
 OPS_SERVICE_URL = os.getenv("OPS_SERVICE_URL", "http://localhost:3002")
 TIMEOUT = 10.0
 
+# One pooled client for the process so keep-alive connections to
+# core-service are reused across assessments (closed in app lifespan).
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared core-service client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client; called on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Short-lived cache so assess / impact / explain calls fired together by the
+# UI share one round of core-service requests.
+CACHE_TTL_SECONDS = float(os.getenv("FETCH_CACHE_TTL_SECONDS", "10"))
+_CACHE_MAX_ENTRIES = 1024
+
+_CacheKey = tuple[str, str, str | None]
+_cache: dict[_CacheKey, tuple[float, Any]] = {}
+_cache_locks: dict[_CacheKey, asyncio.Lock] = {}
+
+
+async def _cached_fetch(
+    kind: str,
+    project_id: str,
+    user_id: str | None,
+    loader: Callable[[str, str | None], Awaitable[Any]],
+) -> Any:
+    """Return a fresh cached value or load it once for concurrent callers."""
+    key = (kind, project_id, user_id)
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another caller may have filled the cache while we waited
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await loader(project_id, user_id)
+        now = time.monotonic()
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            for stale in [k for k, (exp, _) in _cache.items() if exp <= now]:
+                _drop_cache_entry(stale)
+            # Still full of fresh entries: evict the oldest insertions
+            while len(_cache) >= _CACHE_MAX_ENTRIES:
+                _drop_cache_entry(next(iter(_cache)))
+        _cache.pop(key, None)
+        _cache[key] = (now + CACHE_TTL_SECONDS, value)
+        return value
+
+
+def _drop_cache_entry(key: _CacheKey) -> None:
+    _cache.pop(key, None)
+    lock = _cache_locks.get(key)
+    if lock is not None and not lock.locked():
+        del _cache_locks[key]
+
+
+def invalidate_project_cache(project_id: str) -> None:
+    """Drop cached core-service data for a project (all users, all kinds).
+
+    Call after anything that changes the project's plan, progress, or
+    constraints so the next assessment reads fresh data.
+    """
+    for key in [k for k in _cache if k[1] == project_id]:
+        _drop_cache_entry(key)
+
 
 async def fetch_project_activities(
     project_id: str,
@@ -22,54 +110,11 @@ async def fetch_project_activities(
     """
     Fetch activity data for a project from core-service.
     Includes takt assignments, progress records, and constraint info.
+    Results are cached per (project_id, user_id) for CACHE_TTL_SECONDS.
     """
-    headers: dict[str, str] = {}
-    if user_id:
-        headers["x-user-id"] = user_id
-
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        # Fetch takt plan with assignments
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/projects/{project_id}",
-                headers=headers,
-            )
-            if resp.status_code != 200:
-                return []
-            project_data = resp.json().get("data", {})
-        except httpx.RequestError:
-            return []
-
-        # Fetch progress data
-        progress_data: list[dict] = []
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/progress/projects/{project_id}/records",
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                progress_data = resp.json().get("data", [])
-        except httpx.RequestError:
-            pass
-
-        # Fetch constraints
-        constraints: list[dict] = []
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/constraints",
-                params={"projectId": project_id},
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                constraints = resp.json().get("data", [])
-        except httpx.RequestError:
-            pass
-
-        # Build activity data from available sources
-        activities = _build_activity_data(
-            project_data, progress_data, constraints
-        )
-        return activities
+    return await _cached_fetch(
+        "activities", project_id, user_id, _load_project_activities
+    )
 
 
 async def fetch_project_context(
@@ -79,64 +124,235 @@ async def fetch_project_context(
     """
     Fetch project-level context metrics:
     EVM data (CPI, SPI), PPC, resource utilization, constraints summary.
+    Results are cached per (project_id, user_id) for CACHE_TTL_SECONDS.
+    """
+    return await _cached_fetch(
+        "context", project_id, user_id, _load_project_context
+    )
+
+
+async def fetch_projects_bulk(
+    project_ids: list[str],
+    user_id: str | None = None,
+) -> dict[str, tuple[list[dict], dict]]:
+    """
+    Fetch activities and context for several projects (portfolio assessment).
+    Returns {project_id: (activities, context)}.
+
+    core-service has no bulk read endpoints yet, so every project's requests
+    are issued concurrently over the shared client (and through the cache).
+    Swap in a single bulk call here once core-service provides one.
     """
+    unique_ids = list(dict.fromkeys(project_ids))
+    results = await asyncio.gather(
+        *(
+            fetch
+            for pid in unique_ids
+            for fetch in (
+                fetch_project_activities(pid, user_id),
+                fetch_project_context(pid, user_id),
+            )
+        )
+    )
+    return {
+        pid: (results[2 * i], results[2 * i + 1])
+        for i, pid in enumerate(unique_ids)
+    }
+
+
+async def _load_project_activities(
+    project_id: str,
+    user_id: str | None = None,
+) -> list[dict]:
+    """Load activity data from core-service (uncached)."""
     headers: dict[str, str] = {}
     if user_id:
         headers["x-user-id"] = user_id
 
-    context: dict = {}
+    client = get_client()
+    # Project, progress, and constraints are independent: fetch together
+    project_data, progress_data, constraints = await asyncio.gather(
+        _get_project(client, project_id, headers),
+        _get_progress_records(client, project_id, headers),
+        _get_constraints(client, project_id, headers),
+    )
 
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        # Fetch EVM data from cost module
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/cost/evm/project/{project_id}/snapshot",
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                evm = resp.json().get("data", {})
-                context["cpi"] = evm.get("cpi")
-                context["spi"] = evm.get("spi")
-        except httpx.RequestError:
-            pass
-
-        # Fetch PPC data
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/progress/projects/{project_id}/ppc",
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                ppc_data = resp.json().get("data", {})
-                context["current_ppc"] = ppc_data.get("currentPpc")
-                context["previous_ppc"] = ppc_data.get("previousPpc")
-        except httpx.RequestError:
-            pass
-
-        # Fetch constraints summary
-        try:
-            resp = await client.get(
-                f"{CORE_SERVICE_URL}/constraints",
-                params={"projectId": project_id},
-                headers=headers,
-            )
-            if resp.status_code == 200:
-                constraints = resp.json().get("data", [])
-                open_constraints = [
-                    c
-                    for c in constraints
-                    if c.get("status") in ("open", "in_progress")
-                ]
-                context["open_constraints"] = len(open_constraints)
-                context["critical_constraints"] = sum(
-                    1
-                    for c in open_constraints
-                    if c.get("priority") == "critical"
-                )
-        except httpx.RequestError:
-            pass
-
-    return context
+    if project_data is None:
+        return []
+
+    # Build activity data from available sources
+    return _build_activity_data(project_data, progress_data, constraints or [])
+
+
+async def _load_project_context(
+    project_id: str,
+    user_id: str | None = None,
+) -> dict:
+    """Load project-level context metrics from core-service (uncached)."""
+    headers: dict[str, str] = {}
+    if user_id:
+        headers["x-user-id"] = user_id
+
+    client = get_client()
+    # EVM, PPC, and constraints are independent: fetch together
+    evm_context, ppc_context, constraint_context = await asyncio.gather(
+        _get_evm_context(client, project_id, headers),
+        _get_ppc_context(client, project_id, headers),
+        _get_constraint_context(client, project_id, headers),
+    )
+
+    return {**evm_context, **ppc_context, **constraint_context}
+
+
+# ── Core-service requests ──
+# Each helper swallows request errors and non-200 responses, returning an
+# empty payload so one failing endpoint never sinks the others.
+
+# Last (ETag, parsed body) per resource and user. Requests revalidate with
+# If-None-Match, so an unchanged resource costs a 304 and no JSON parsing.
+_ETAG_MAX_ENTRIES = 1024
+_etag_cache: dict[tuple[str, str | None], tuple[str, Any]] = {}
+
+
+def _json(resp: httpx.Response) -> Any:
+    """Decode a response body with orjson (empty body -> empty dict)."""
+    return orjson.loads(resp.content) if resp.content else {}
+
+
+async def _get_json(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    params: dict[str, str] | None = None,
+) -> Any:
+    """GET a core-service resource; the parsed body, or None unless 200/304."""
+    key = (str(httpx.URL(url, params=params)), headers.get("x-user-id"))
+    cached = _etag_cache.get(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+
+    resp = await client.get(url, params=params, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        return cached[1]
+    if resp.status_code != 200:
+        return None
+
+    body = _json(resp)
+    etag = resp.headers.get("etag")
+    if etag:
+        if key not in _etag_cache and len(_etag_cache) >= _ETAG_MAX_ENTRIES:
+            del _etag_cache[next(iter(_etag_cache))]
+        _etag_cache[key] = (etag, body)
+    return body
+
+
+async def _get_project(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> dict | None:
+    """Fetch the takt plan with assignments; None when unavailable."""
+    try:
+        body = await _get_json(
+            client, f"{CORE_SERVICE_URL}/projects/{project_id}", headers
+        )
+    except httpx.RequestError:
+        return None
+    if body is None:
+        return None
+    return body.get("data", {})
+
+
+async def _get_progress_records(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> list[dict]:
+    """Fetch progress records for the project."""
+    try:
+        body = await _get_json(
+            client,
+            f"{CORE_SERVICE_URL}/progress/projects/{project_id}/records",
+            headers,
+        )
+    except httpx.RequestError:
+        return []
+    if body is None:
+        return []
+    return body.get("data", [])
+
+
+async def _get_constraints(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> list[dict] | None:
+    """Fetch constraints registered against the project; None when unavailable."""
+    try:
+        body = await _get_json(
+            client,
+            f"{CORE_SERVICE_URL}/constraints",
+            headers,
+            params={"projectId": project_id},
+        )
+    except httpx.RequestError:
+        return None
+    if body is None:
+        return None
+    return body.get("data", [])
+
+
+async def _get_evm_context(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> dict:
+    """Fetch CPI/SPI from the cost module's EVM snapshot."""
+    try:
+        body = await _get_json(
+            client,
+            f"{CORE_SERVICE_URL}/cost/evm/project/{project_id}/snapshot",
+            headers,
+        )
+    except httpx.RequestError:
+        return {}
+    if body is None:
+        return {}
+    evm = body.get("data", {})
+    return {"cpi": evm.get("cpi"), "spi": evm.get("spi")}
+
+
+async def _get_ppc_context(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> dict:
+    """Fetch current and previous PPC."""
+    try:
+        body = await _get_json(
+            client,
+            f"{CORE_SERVICE_URL}/progress/projects/{project_id}/ppc",
+            headers,
+        )
+    except httpx.RequestError:
+        return {}
+    if body is None:
+        return {}
+    ppc_data = body.get("data", {})
+    return {
+        "current_ppc": ppc_data.get("currentPpc"),
+        "previous_ppc": ppc_data.get("previousPpc"),
+    }
+
+
+async def _get_constraint_context(
+    client: httpx.AsyncClient, project_id: str, headers: dict[str, str]
+) -> dict:
+    """Summarize open and critical constraints."""
+    constraints = await _get_constraints(client, project_id, headers)
+    if constraints is None:
+        return {}
+    open_count = critical_count = 0
+    for c in constraints:
+        status = c.get("status")
+        if status == "open" or status == "in_progress":
+            open_count += 1
+            if c.get("priority") == "critical":
+                critical_count += 1
+    return {
+        "open_constraints": open_count,
+        "critical_constraints": critical_count,
+    }
 
 
 def _build_activity_data(
@@ -151,54 +367,57 @@ def _build_activity_data(
     trades = project_data.get("trades", [])
     locations = project_data.get("locations", [])
 
-    # Build progress lookup by trade+location
-    progress_lookup: dict[str, dict] = {}
-    for record in progress_data:
-        key = f"{record.get('tradeId')}:{record.get('locationId')}"
-        progress_lookup[key] = record
+    # Build progress lookup by (trade, location)
+    progress_lookup: dict[tuple[Any, Any], dict] = {
+        (record.get("tradeId"), record.get("locationId")): record
+        for record in progress_data
+    }
 
-    # Build constraint lookup by trade/location
-    constraint_lookup: dict[str, list[dict]] = {}
+    # Predecessor constraints per trade, built once and shared (read-only)
+    # by every location of that trade
+    predecessors_by_trade: dict[str, list[dict]] = {}
     for c in constraints:
         trade_id = c.get("tradeId", "")
-        if trade_id:
-            constraint_lookup.setdefault(trade_id, []).append(c)
+        if trade_id and c.get("category") == "predecessor":
+            predecessors_by_trade.setdefault(trade_id, []).append(
+                {
+                    "id": c.get("id"),
+                    "is_delayed": c.get("status") in ("open", "in_progress"),
+                }
+            )
+
+    # Location fields do not depend on the trade
+    location_fields = [
+        (
+            location.get("id", ""),
+            location.get("name", ""),
+            location.get("locationType") == "site",
+        )
+        for location in locations
+    ]
 
     activities: list[dict] = []
     for trade in trades:
         trade_id = trade.get("id", "")
-        for location in locations:
-            loc_id = location.get("id", "")
-            key = f"{trade_id}:{loc_id}"
-            progress = progress_lookup.get(key, {})
-
-            activity = {
-                "id": f"{trade_id}:{loc_id}",
-                "trade_id": trade_id,
-                "trade_name": trade.get("name", ""),
-                "location_id": loc_id,
-                "location_name": location.get("name", ""),
-                "percent_complete": progress.get("percentComplete"),
-                "expected_percent": progress.get("expectedPercent"),
-                "total_float": progress.get("totalFloat"),
-                "is_critical": progress.get("isCritical", False),
-                "is_outdoor": location.get("locationType") == "site",
-                "predecessors": [],
-            }
-
-            # Add constraint-based predecessor delay info
-            trade_constraints = constraint_lookup.get(trade_id, [])
-            predecessor_info = [
+        trade_name = trade.get("name", "")
+        predecessors = predecessors_by_trade.get(trade_id, [])
+        for loc_id, loc_name, is_outdoor in location_fields:
+            progress = progress_lookup.get((trade_id, loc_id), {})
+            activities.append(
                 {
-                    "id": c.get("id"),
-                    "is_delayed": c.get("status") in ("open", "in_progress")
-                    and c.get("category") == "predecessor",
+                    "id": f"{trade_id}:{loc_id}",
+                    "trade_id": trade_id,
+                    "trade_name": trade_name,
+                    "location_id": loc_id,
+                    "location_name": loc_name,
+                    "percent_complete": progress.get("percentComplete"),
+                    "expected_percent": progress.get("expectedPercent"),
+                    "total_float": progress.get("totalFloat"),
+                    "is_critical": progress.get("isCritical", False),
+                    "is_outdoor": is_outdoor,
+                    # Constraint-based predecessor delay info
+                    "predecessors": predecessors,
                 }
-                for c in trade_constraints
-                if c.get("category") == "predecessor"
-            ]
-            activity["predecessors"] = predecessor_info
-
-            activities.append(activity)
+            )
 
     return activities
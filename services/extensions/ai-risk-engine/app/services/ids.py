@@ -0,0 +1,44 @@
+"""
+AI Risk Engine — Record Identifiers
+
+Time-ordered UUIDv7 ids for assessments and outcomes: a 48-bit millisecond
+timestamp followed by random bits. Ids sort by creation time (index-friendly
+once records move to the database), and the random bits are drawn from a
+buffer refilled with one urandom read per batch instead of one per id.
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_RANDOM_BYTES_PER_ID = 10  # 80 bits; 74 are used after version/variant
+_RANDOM_BATCH = 1024
+
+_random_buffer = b""
+_random_offset = 0
+# Large assessments run in worker threads; keep buffer slices unique
+_random_lock = threading.Lock()
+
+
+def new_id() -> str:
+    """Return a new UUIDv7 string."""
+    global _random_buffer, _random_offset
+    with _random_lock:
+        if _random_offset >= len(_random_buffer):
+            _random_buffer = os.urandom(_RANDOM_BYTES_PER_ID * _RANDOM_BATCH)
+            _random_offset = 0
+        start = _random_offset
+        _random_offset += _RANDOM_BYTES_PER_ID
+        chunk = _random_buffer[start : start + _RANDOM_BYTES_PER_ID]
+    rand = int.from_bytes(chunk, "big")
+
+    unix_ms = time.time_ns() // 1_000_000
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 68) << 64  # rand_a: 12 bits
+        | 0b10 << 62  # RFC 4122 variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)  # rand_b: 62 bits
+    )
+    return str(uuid.UUID(int=value))
@@ -10,9 +10,10 @@ Evolution Strategy:
   Stage 3 (>=200 projects): Full ML replaces scoring
 """
 
-import uuid
-from datetime import datetime
-from typing import Optional
+import string
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
 
 from app.models.risk import (
     RiskAssessmentResult,
@@ -21,6 +22,9 @@ from app.models.risk import (
     RiskLevel,
     RiskRuleConfig,
 )
+from app.services.ids import new_id
+
+_UTC = timezone.utc
 
 
 # ── Default Rule Set ──
@@ -129,6 +133,137 @@ DEFAULT_RULES: list[RiskRuleConfig] = [
 ]
 
 
+class _ActivityMetrics(NamedTuple):
+    """Per-activity values used by activity-level rules, gathered in one pass."""
+
+    total_floats: list[float]
+    # (percent_complete, expected_percent) of the critical activity furthest
+    # behind plan, or None when no critical activity is behind
+    worst_critical_behind: Optional[tuple[float, float]]
+    outdoor_count: int
+    delayed_predecessor_count: int
+    # Activities providing each completeness field: total_float,
+    # percent_complete, predecessors, is_critical
+    field_counts: tuple[int, int, int, int]
+
+
+def _collect_activity_metrics(activities: list[dict]) -> _ActivityMetrics:
+    total_floats: list[float] = []
+    worst_critical_behind: Optional[tuple[float, float]] = None
+    worst_gap = 0.0
+    outdoor_count = 0
+    delayed_predecessor_count = 0
+    has_percent = has_predecessors = has_critical = 0
+    for a in activities:
+        total_float = a.get("total_float")
+        if total_float is not None:
+            total_floats.append(total_float)
+        actual = a.get("percent_complete")
+        has_percent += actual is not None
+        is_critical = a.get("is_critical")
+        has_critical += is_critical is not None
+        if is_critical:
+            expected = a.get("expected_percent")
+            if actual is not None and expected is not None and actual < expected:
+                gap = actual - expected
+                if worst_critical_behind is None or gap < worst_gap:
+                    worst_critical_behind, worst_gap = (actual, expected), gap
+        if a.get("is_outdoor", False):
+            outdoor_count += 1
+        # Cheap emptiness check first; only scan real predecessor lists
+        predecessors = a.get("predecessors")
+        has_predecessors += predecessors is not None
+        if predecessors and any(p.get("is_delayed", False) for p in predecessors):
+            delayed_predecessor_count += 1
+    return _ActivityMetrics(
+        total_floats,
+        worst_critical_behind,
+        outdoor_count,
+        delayed_predecessor_count,
+        (len(total_floats), has_percent, has_predecessors, has_critical),
+    )
+
+
+# ── Recommendations per triggered risk category ──
+
+_CATEGORY_RECS: dict[RiskCategory, tuple[str, ...]] = {
+    RiskCategory.SCHEDULE: (
+        "Review critical path activities and consider adding buffers",
+        "Increase monitoring frequency for low-float activities",
+    ),
+    RiskCategory.RESOURCE: (
+        "Review resource allocation and consider adding backup crews",
+        "Evaluate overtime options for overallocated resources",
+    ),
+    RiskCategory.DEPENDENCY: (
+        "Expedite predecessor activities that are behind schedule",
+        "Identify alternative sequencing to reduce dependency chains",
+    ),
+    RiskCategory.WEATHER: (
+        "Prepare weather contingency plans for outdoor activities",
+        "Consider rescheduling weather-sensitive work to favorable periods",
+    ),
+    RiskCategory.COST: (
+        "Review cost performance and identify areas for savings",
+        "Update Estimate at Completion (EAC) projections",
+    ),
+    RiskCategory.COMPLEXITY: (
+        "Review zone assignments to reduce trade stacking",
+        "Consider adding buffer periods between trades in congested zones",
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Callable[[dict], str]:
+    """Parse an explanation template once into a reusable renderer.
+
+    Plain ``{name}`` fields compile to a ``%(name)s`` string rendered with
+    ``%``; templates using format specs or conversions keep ``format_map``.
+    """
+    parts: list[str] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return template.format_map
+        parts.append(f"%({field})s")
+    return "".join(parts).__mod__
+
+
+def _explain(rule: RiskRuleConfig, **values: object) -> str:
+    """Render a rule's explanation template with the triggered values."""
+    return _compile_template(rule.explanation_template)(values)
+
+
+def _factor(
+    rule: RiskRuleConfig,
+    current_value: float,
+    threshold: float,
+    explanation: str,
+) -> RiskFactor:
+    """Build a triggered-rule factor without re-running validation.
+
+    Every field comes from an already-validated rule or is coerced here,
+    so the pydantic validation pass would only repeat work.
+    """
+    return RiskFactor.model_construct(
+        rule_id=rule.id,
+        name=rule.name,
+        category=rule.category,
+        weight=rule.weight,
+        current_value=float(current_value),
+        threshold=float(threshold),
+        explanation=explanation,
+    )
+
+
+_RuleHandler = Callable[
+    [RiskRuleConfig, _ActivityMetrics, dict], Optional[RiskFactor]
+]
+
+
 class RuleBasedRiskEngine:
     """
     Stage 1: Deterministic, transparent, configurable.
@@ -136,13 +271,82 @@ class RuleBasedRiskEngine:
     """
 
     def __init__(self, rules: Optional[list[RiskRuleConfig]] = None):
-        self.rules = rules or DEFAULT_RULES
+        self._handlers: dict[str, _RuleHandler] = {
+            "low_float": self._rule_low_float,
+            "resource_over_90": self._rule_resource_over_90,
+            "predecessor_delayed": self._rule_predecessor_delayed,
+            "outdoor_rain_risk": self._rule_outdoor_rain_risk,
+            "critical_path_behind": self._rule_critical_path_behind,
+            "cpi_below_threshold": self._rule_cpi_below_threshold,
+            "spi_below_threshold": self._rule_spi_below_threshold,
+            "trade_stacking": self._rule_trade_stacking,
+            "high_open_constraints": self._rule_high_open_constraints,
+            "ppc_declining": self._rule_ppc_declining,
+        }
+        self.set_rules(rules or DEFAULT_RULES)
+
+    def set_rules(self, rules: list[RiskRuleConfig]) -> None:
+        """Replace the rule set and rebuild the derived lookups."""
+        # Own the list so copied rules never land in the caller's list
+        # (e.g. the module-level DEFAULT_RULES)
+        self.rules = list(rules)
+        self._rules_by_id: dict[str, RiskRuleConfig] = {
+            r.id: r for r in self.rules
+        }
+        # Rules may be shared with other engines until first modified
+        self._owned_rule_ids: set[str] = set()
+        self._refresh_active_rules()
+
+    def _refresh_active_rules(self) -> None:
+        # Resolve each active rule's handler once, not on every assessment
+        self._active_rules: tuple[
+            tuple[RiskRuleConfig, Optional[_RuleHandler]], ...
+        ] = tuple(
+            (r, self._handlers.get(r.condition)) for r in self.rules if r.is_active
+        )
+
+    def get_rule(self, rule_id: str) -> Optional[RiskRuleConfig]:
+        """Look up a rule by its code (e.g. R001)."""
+        return self._rules_by_id.get(rule_id)
+
+    def get_mutable_rule(self, rule_id: str) -> Optional[RiskRuleConfig]:
+        """Look up a rule for modification, copying it on first write."""
+        rule = self._rules_by_id.get(rule_id)
+        if rule is None or rule_id in self._owned_rule_ids:
+            return rule
+        owned = rule.model_copy()
+        self.rules[self.rules.index(rule)] = owned
+        self._rules_by_id[rule_id] = owned
+        self._owned_rule_ids.add(rule_id)
+        self._refresh_active_rules()
+        return owned
+
+    def update_rule(
+        self,
+        rule_id: str,
+        weight: Optional[float] = None,
+        risk_contribution: Optional[float] = None,
+        is_active: Optional[bool] = None,
+    ) -> Optional[RiskRuleConfig]:
+        """Apply configuration changes to a rule; None if it does not exist."""
+        rule = self.get_mutable_rule(rule_id)
+        if rule is None:
+            return None
+        if weight is not None:
+            rule.weight = weight
+        if risk_contribution is not None:
+            rule.risk_contribution = risk_contribution
+        if is_active is not None:
+            rule.is_active = is_active
+        self._refresh_active_rules()
+        return rule
 
     def assess(
         self,
         project_id: str,
         activity_data: list[dict],
         project_context: dict,
+        fast_path: bool = False,
     ) -> RiskAssessmentResult:
         """
         Assess risk for a project based on activity data and context.
@@ -151,20 +355,47 @@ class RuleBasedRiskEngine:
             project_id: The project to assess
             activity_data: List of activity records with metrics
             project_context: Project-level metrics (EVM, PPC, constraints, etc.)
+            fast_path: Evaluate highest-impact rules first and stop once the
+                remaining rules can no longer change the overall risk level.
+                The level is exact; factors and delay probability may be
+                partial. Use the default full path for detailed UI output.
         """
-        active_rules = [r for r in self.rules if r.is_active]
+        active_rules = self._active_rules
         triggered_factors: list[RiskFactor] = []
         total_score = 0.0
+        rules_evaluated = len(active_rules)
+
+        if fast_path:
+            active_rules = sorted(
+                active_rules,
+                key=lambda entry: entry[0].weight * entry[0].risk_contribution,
+                reverse=True,
+            )
+            remaining = sum(r.weight * r.risk_contribution for r, _ in active_rules)
+
+        # Scan activities once; rules read the collected metrics
+        metrics = _collect_activity_metrics(activity_data)
 
-        for rule in active_rules:
-            result = self._evaluate_rule(rule, activity_data, project_context)
+        for i, (rule, handler) in enumerate(active_rules):
+            result = (
+                handler(rule, metrics, project_context)
+                if handler is not None
+                else None
+            )
             if result is not None:
                 triggered_factors.append(result)
                 total_score += rule.weight * rule.risk_contribution
+            if fast_path:
+                remaining -= rule.weight * rule.risk_contribution
+                if self._score_to_level(total_score) == self._score_to_level(
+                    total_score + remaining
+                ):
+                    rules_evaluated = i + 1
+                    break
 
         # Calculate data completeness
         data_completeness = self._calculate_data_completeness(
-            activity_data, project_context
+            len(activity_data), metrics, project_context
         )
 
         # Confidence = data completeness percentage
@@ -174,9 +405,9 @@ class RuleBasedRiskEngine:
         recommendations = self._generate_recommendations(triggered_factors)
 
         return RiskAssessmentResult(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             projectId=project_id,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(_UTC),
             overallRisk=self._score_to_level(total_score),
             delayProbability=min(total_score, 1.0),
             confidenceScore=confidence,
@@ -184,219 +415,232 @@ class RuleBasedRiskEngine:
             recommendations=recommendations,
             engineStage="rule_based_v1",
             dataCompleteness=data_completeness,
-            rulesEvaluated=len(active_rules),
+            rulesEvaluated=rules_evaluated,
             rulesTriggered=len(triggered_factors),
         )
 
-    def _evaluate_rule(
+    # ── Rule handlers (one per condition key) ──
+
+    def _rule_low_float(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Activities with total float below the threshold."""
+        threshold = context.get("float_threshold_days", 3)
+        low_floats = [f for f in metrics.total_floats if f < threshold]
+        if low_floats:
+            avg_float = sum(low_floats) / len(low_floats)
+            return _factor(
+                rule,
+                current_value=avg_float,
+                threshold=float(threshold),
+                explanation=_explain(
+                    rule,
+                    float_days=round(avg_float, 1),
+                    threshold=threshold,
+                ),
+            )
+        return None
+
+    def _rule_resource_over_90(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Resource utilization above 90%."""
+        utilization = context.get("resource_utilization")
+        if utilization is not None and utilization > 0.90:
+            return _factor(
+                rule,
+                current_value=utilization,
+                threshold=0.90,
+                explanation=_explain(
+                    rule,
+                    utilization=round(utilization * 100, 1)
+                ),
+            )
+        return None
+
+    def _rule_predecessor_delayed(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Activities waiting on delayed predecessors."""
+        delayed_count = metrics.delayed_predecessor_count
+        if delayed_count > 0:
+            return _factor(
+                rule,
+                current_value=float(delayed_count),
+                threshold=0.0,
+                explanation=_explain(
+                    rule,
+                    delayed_count=delayed_count
+                ),
+            )
+        return None
+
+    def _rule_outdoor_rain_risk(
         self,
         rule: RiskRuleConfig,
-        activities: list[dict],
+        metrics: _ActivityMetrics,
         context: dict,
     ) -> Optional[RiskFactor]:
-        """Evaluate a single rule against project data."""
-
-        condition = rule.condition
-
-        if condition == "low_float":
-            threshold = context.get("float_threshold_days", 3)
-            low_float_activities = [
-                a
-                for a in activities
-                if a.get("total_float") is not None
-                and a["total_float"] < threshold
-            ]
-            if low_float_activities:
-                avg_float = sum(
-                    a["total_float"] for a in low_float_activities
-                ) / len(low_float_activities)
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=avg_float,
-                    threshold=float(threshold),
-                    explanation=rule.explanation_template.format(
-                        float_days=round(avg_float, 1),
-                        threshold=threshold,
-                    ),
-                )
-
-        elif condition == "resource_over_90":
-            utilization = context.get("resource_utilization")
-            if utilization is not None and utilization > 0.90:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=utilization,
-                    threshold=0.90,
-                    explanation=rule.explanation_template.format(
-                        utilization=round(utilization * 100, 1)
-                    ),
-                )
-
-        elif condition == "predecessor_delayed":
-            delayed_count = sum(
-                1
-                for a in activities
-                if any(
-                    p.get("is_delayed", False)
-                    for p in a.get("predecessors", [])
-                )
+        """Outdoor work with a high rain probability."""
+        rain_prob = context.get("weather_rain_probability")
+        outdoor_count = metrics.outdoor_count
+        if rain_prob is not None and rain_prob > 0.6 and outdoor_count > 0:
+            return _factor(
+                rule,
+                current_value=rain_prob,
+                threshold=0.6,
+                explanation=_explain(
+                    rule,
+                    rain_prob=round(rain_prob * 100, 1)
+                ),
             )
-            if delayed_count > 0:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=float(delayed_count),
-                    threshold=0.0,
-                    explanation=rule.explanation_template.format(
-                        delayed_count=delayed_count
-                    ),
-                )
-
-        elif condition == "outdoor_rain_risk":
-            rain_prob = context.get("weather_rain_probability")
-            outdoor_count = sum(
-                1 for a in activities if a.get("is_outdoor", False)
+        return None
+
+    def _rule_critical_path_behind(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Critical activities behind expected progress."""
+        if metrics.worst_critical_behind is not None:
+            actual, expected = metrics.worst_critical_behind
+            return _factor(
+                rule,
+                current_value=actual,
+                threshold=expected,
+                explanation=_explain(
+                    rule,
+                    actual=round(actual, 1),
+                    expected=round(expected, 1),
+                ),
+            )
+        return None
+
+    def _rule_cpi_below_threshold(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Cost performance index below 0.95."""
+        cpi = context.get("cpi")
+        if cpi is not None and cpi < 0.95:
+            return _factor(
+                rule,
+                current_value=cpi,
+                threshold=0.95,
+                explanation=_explain(
+                    rule,
+                    cpi=round(cpi, 3)
+                ),
+            )
+        return None
+
+    def _rule_spi_below_threshold(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Schedule performance index below 0.95."""
+        spi = context.get("spi")
+        if spi is not None and spi < 0.95:
+            return _factor(
+                rule,
+                current_value=spi,
+                threshold=0.95,
+                explanation=_explain(
+                    rule,
+                    spi=round(spi, 3)
+                ),
+            )
+        return None
+
+    def _rule_trade_stacking(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """Zones with several trades working at once."""
+        stacking_zones = context.get("stacking_zones", [])
+        if stacking_zones:
+            worst_zone = max(stacking_zones, key=lambda z: z.get("trade_count", 0))
+            return _factor(
+                rule,
+                current_value=float(worst_zone.get("trade_count", 0)),
+                threshold=1.0,
+                explanation=_explain(
+                    rule,
+                    stacked_trades=worst_zone.get("trade_count", 0),
+                    zone_name=worst_zone.get("zone_name", "unknown"),
+                ),
             )
-            if rain_prob is not None and rain_prob > 0.6 and outdoor_count > 0:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=rain_prob,
-                    threshold=0.6,
-                    explanation=rule.explanation_template.format(
-                        rain_prob=round(rain_prob * 100, 1)
-                    ),
-                )
-
-        elif condition == "critical_path_behind":
-            critical_behind = [
-                a
-                for a in activities
-                if a.get("is_critical", False)
-                and a.get("percent_complete") is not None
-                and a.get("expected_percent") is not None
-                and a["percent_complete"] < a["expected_percent"]
-            ]
-            if critical_behind:
-                worst = min(
-                    critical_behind,
-                    key=lambda a: a["percent_complete"]
-                    - a["expected_percent"],
-                )
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=worst["percent_complete"],
-                    threshold=worst["expected_percent"],
-                    explanation=rule.explanation_template.format(
-                        actual=round(worst["percent_complete"], 1),
-                        expected=round(worst["expected_percent"], 1),
-                    ),
-                )
-
-        elif condition == "cpi_below_threshold":
-            cpi = context.get("cpi")
-            if cpi is not None and cpi < 0.95:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=cpi,
-                    threshold=0.95,
-                    explanation=rule.explanation_template.format(
-                        cpi=round(cpi, 3)
-                    ),
-                )
-
-        elif condition == "spi_below_threshold":
-            spi = context.get("spi")
-            if spi is not None and spi < 0.95:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=spi,
-                    threshold=0.95,
-                    explanation=rule.explanation_template.format(
-                        spi=round(spi, 3)
-                    ),
-                )
-
-        elif condition == "trade_stacking":
-            stacking_zones = context.get("stacking_zones", [])
-            if stacking_zones:
-                worst_zone = max(stacking_zones, key=lambda z: z.get("trade_count", 0))
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=float(worst_zone.get("trade_count", 0)),
-                    threshold=1.0,
-                    explanation=rule.explanation_template.format(
-                        stacked_trades=worst_zone.get("trade_count", 0),
-                        zone_name=worst_zone.get("zone_name", "unknown"),
-                    ),
-                )
-
-        elif condition == "high_open_constraints":
-            open_count = context.get("open_constraints", 0)
-            critical_count = context.get("critical_constraints", 0)
-            threshold = context.get("constraint_threshold", 5)
-            if open_count > threshold:
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=float(open_count),
-                    threshold=float(threshold),
-                    explanation=rule.explanation_template.format(
-                        open_count=open_count,
-                        critical_count=critical_count,
-                    ),
-                )
-
-        elif condition == "ppc_declining":
-            current_ppc = context.get("current_ppc")
-            prev_ppc = context.get("previous_ppc")
-            if (
-                current_ppc is not None
-                and prev_ppc is not None
-                and current_ppc < prev_ppc
-            ):
-                return RiskFactor(
-                    ruleId=rule.id,
-                    name=rule.name,
-                    category=rule.category,
-                    weight=rule.weight,
-                    currentValue=current_ppc,
-                    threshold=prev_ppc,
-                    explanation=rule.explanation_template.format(
-                        current_ppc=round(current_ppc, 1),
-                        prev_ppc=round(prev_ppc, 1),
-                    ),
-                )
+        return None
 
+    def _rule_high_open_constraints(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """More open constraints than the threshold."""
+        open_count = context.get("open_constraints", 0)
+        critical_count = context.get("critical_constraints", 0)
+        threshold = context.get("constraint_threshold", 5)
+        if open_count > threshold:
+            return _factor(
+                rule,
+                current_value=float(open_count),
+                threshold=float(threshold),
+                explanation=_explain(
+                    rule,
+                    open_count=open_count,
+                    critical_count=critical_count,
+                ),
+            )
+        return None
+
+    def _rule_ppc_declining(
+        self,
+        rule: RiskRuleConfig,
+        metrics: _ActivityMetrics,
+        context: dict,
+    ) -> Optional[RiskFactor]:
+        """PPC lower than the previous period."""
+        current_ppc = context.get("current_ppc")
+        prev_ppc = context.get("previous_ppc")
+        if (
+            current_ppc is not None
+            and prev_ppc is not None
+            and current_ppc < prev_ppc
+        ):
+            return _factor(
+                rule,
+                current_value=current_ppc,
+                threshold=prev_ppc,
+                explanation=_explain(
+                    rule,
+                    current_ppc=round(current_ppc, 1),
+                    prev_ppc=round(prev_ppc, 1),
+                ),
+            )
         return None
 
     def _calculate_data_completeness(
         self,
-        activities: list[dict],
+        activity_count: int,
+        metrics: _ActivityMetrics,
         context: dict,
     ) -> float:
         """Calculate how complete the input data is (affects confidence)."""
@@ -414,16 +658,14 @@ class RuleBasedRiskEngine:
             "open_constraints",
         ]
 
-        if not activities:
+        if not activity_count:
             return 0.0
 
-        # Check activity data completeness
+        # Check activity data completeness (counted during the metrics pass,
+        # in required_fields order)
         activity_completeness = 0.0
-        for field in required_fields:
-            has_field = sum(
-                1 for a in activities if a.get(field) is not None
-            )
-            activity_completeness += has_field / len(activities)
+        for has_field in metrics.field_counts:
+            activity_completeness += has_field / activity_count
         activity_completeness /= len(required_fields)
 
         # Check context data completeness
@@ -449,38 +691,11 @@ class RuleBasedRiskEngine:
         self, factors: list[RiskFactor]
     ) -> list[str]:
         """Generate actionable recommendations based on triggered rules."""
-        recommendations: list[str] = []
-
-        category_recs = {
-            RiskCategory.SCHEDULE: [
-                "Review critical path activities and consider adding buffers",
-                "Increase monitoring frequency for low-float activities",
-            ],
-            RiskCategory.RESOURCE: [
-                "Review resource allocation and consider adding backup crews",
-                "Evaluate overtime options for overallocated resources",
-            ],
-            RiskCategory.DEPENDENCY: [
-                "Expedite predecessor activities that are behind schedule",
-                "Identify alternative sequencing to reduce dependency chains",
-            ],
-            RiskCategory.WEATHER: [
-                "Prepare weather contingency plans for outdoor activities",
-                "Consider rescheduling weather-sensitive work to favorable periods",
-            ],
-            RiskCategory.COST: [
-                "Review cost performance and identify areas for savings",
-                "Update Estimate at Completion (EAC) projections",
-            ],
-            RiskCategory.COMPLEXITY: [
-                "Review zone assignments to reduce trade stacking",
-                "Consider adding buffer periods between trades in congested zones",
-            ],
-        }
-
-        triggered_categories = set(f.category for f in factors)
-        for cat in triggered_categories:
-            recs = category_recs.get(cat, [])
-            recommendations.extend(recs)
-
-        return recommendations
+        # Categories in order of first trigger; dict keys dedupe while
+        # keeping that order deterministic
+        categories = dict.fromkeys(f.category for f in factors)
+        return list(
+            dict.fromkeys(
+                rec for cat in categories for rec in _CATEGORY_RECS.get(cat, ())
+            )
+        )
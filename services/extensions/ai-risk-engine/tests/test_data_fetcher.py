@@ -0,0 +1,69 @@
+"""
+Tests for the core-service data fetcher.
+
+Verifies:
+- Bulk fetches pair each project with its own activities and context
+- Duplicate project ids are fetched once and results keep request order
+"""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from app.services import data_fetcher
+
+
+@pytest.fixture(autouse=True)
+def _fake_core_service(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[list[tuple[str, str]]]:
+    calls: list[tuple[str, str]] = []
+
+    async def load_activities(project_id: str, user_id: str | None = None) -> list[dict]:
+        calls.append(("activities", project_id))
+        # Finish in reverse order of the requests to exercise the pairing
+        await asyncio.sleep(0.001 * (10 - len(project_id)))
+        return [{"id": f"{project_id}:a1"}]
+
+    async def load_context(project_id: str, user_id: str | None = None) -> dict:
+        calls.append(("context", project_id))
+        return {"project": project_id}
+
+    monkeypatch.setattr(data_fetcher, "_load_project_activities", load_activities)
+    monkeypatch.setattr(data_fetcher, "_load_project_context", load_context)
+    data_fetcher._cache.clear()
+    data_fetcher._cache_locks.clear()
+    yield calls
+    data_fetcher._cache.clear()
+    data_fetcher._cache_locks.clear()
+
+
+class TestFetchProjectsBulk:
+    """Portfolio fetches pair results with the right project."""
+
+    def test_results_paired_in_request_order(self) -> None:
+        result = asyncio.run(data_fetcher.fetch_projects_bulk(["p1", "p22", "p333"]))
+        assert list(result) == ["p1", "p22", "p333"]
+        for pid, (activities, context) in result.items():
+            assert activities == [{"id": f"{pid}:a1"}]
+            assert context == {"project": pid}
+
+    def test_duplicate_ids_fetched_once(
+        self, _fake_core_service: list[tuple[str, str]]
+    ) -> None:
+        result = asyncio.run(
+            data_fetcher.fetch_projects_bulk(["p2", "p1", "p2", "p1"])
+        )
+        assert list(result) == ["p2", "p1"]
+        assert result["p1"][1] == {"project": "p1"}
+        assert result["p2"][1] == {"project": "p2"}
+        assert sorted(_fake_core_service) == [
+            ("activities", "p1"),
+            ("activities", "p2"),
+            ("context", "p1"),
+            ("context", "p2"),
+        ]
+
+    def test_empty_request(self) -> None:
+        assert asyncio.run(data_fetcher.fetch_projects_bulk([])) == {}
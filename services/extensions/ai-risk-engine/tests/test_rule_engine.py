@@ -10,7 +10,7 @@ Verifies:
 """
 
 from app.models.risk import RiskLevel
-from app.services.rule_engine import RuleBasedRiskEngine
+from app.services.rule_engine import DEFAULT_RULES, RuleBasedRiskEngine
 
 
 def _make_engine() -> RuleBasedRiskEngine:
@@ -100,6 +100,28 @@ class TestRiskLevels:
         result = engine.assess("proj-1", activities, context)
         assert result.overall_risk in (RiskLevel.HIGH, RiskLevel.CRITICAL)
 
+    def test_fast_path_matches_full_level(self) -> None:
+        engine = _make_engine()
+        cases = [
+            ([_base_activity(total_float=10)], _base_context()),
+            (
+                [
+                    _base_activity(
+                        total_float=1,
+                        is_critical=True,
+                        percent_complete=20.0,
+                        expected_percent=50.0,
+                    )
+                ],
+                _base_context(cpi=0.80, spi=0.75),
+            ),
+        ]
+        for activities, context in cases:
+            full = engine.assess("proj-1", activities, context)
+            fast = engine.assess("proj-1", activities, context, fast_path=True)
+            assert fast.overall_risk == full.overall_risk
+            assert fast.rules_evaluated <= full.rules_evaluated
+
 
 class TestIndividualRules:
     """Each rule triggers as expected."""
@@ -247,3 +269,49 @@ class TestTransparency:
         result = engine.assess("proj-1", activities, context)
         if result.factors:
             assert len(result.recommendations) > 0
+
+
+class TestRuleLookup:
+    """Rules can be looked up by code for per-project tuning."""
+
+    def test_get_rule_by_id(self) -> None:
+        engine = _make_engine()
+        rule = engine.get_rule("R005")
+        assert rule is not None
+        assert rule.condition == "critical_path_behind"
+        assert engine.get_rule("R999") is None
+
+    def test_mutable_rule_does_not_touch_defaults(self) -> None:
+        engine = RuleBasedRiskEngine(rules=list(DEFAULT_RULES))
+        rule = engine.get_mutable_rule("R005")
+        assert rule is not None
+        rule.weight = 0.1
+        assert engine.get_rule("R005") is rule
+        assert rule in engine.rules
+        assert engine.get_mutable_rule("R005") is rule
+        default = next(r for r in DEFAULT_RULES if r.id == "R005")
+        assert default.weight != 0.1
+
+    def test_update_rule_deactivation_applies_to_assess(self) -> None:
+        engine = RuleBasedRiskEngine(rules=list(DEFAULT_RULES))
+        activities = [_base_activity()]
+        context = _base_context(cpi=0.80)
+        before = engine.assess("p", activities, context)
+        assert any(f.rule_id == "R006" for f in before.factors)
+
+        rule = engine.update_rule("R006", is_active=False)
+        assert rule is not None and not rule.is_active
+        result = engine.assess("p", activities, context)
+        assert all(f.rule_id != "R006" for f in result.factors)
+        assert result.rules_evaluated == len(DEFAULT_RULES) - 1
+        assert engine.update_rule("R999", weight=0.5) is None
+
+    def test_update_rule_on_default_engine_keeps_defaults(self) -> None:
+        default = next(r for r in DEFAULT_RULES if r.id == "R001")
+        original_weight = default.weight
+        engine = RuleBasedRiskEngine()
+        engine.update_rule("R001", weight=0.99)
+        assert engine.get_rule("R001").weight == 0.99
+        assert DEFAULT_RULES[0] is default
+        assert default.weight == original_weight
+        assert RuleBasedRiskEngine().get_rule("R001").weight == original_weight
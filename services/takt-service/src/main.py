@@ -6,12 +6,10 @@ Consolidates: takt-engine, flowline, simulation
 import logging
 import os
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-
-# Import routers from each module
-# takt-engine has routes directly in main.py, so we need to import its app's routes
-# Actually the takt-engine routes are defined on its own app object, so we create a router
+from fastapi.responses import ORJSONResponse
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +22,7 @@ app = FastAPI(
     title="SmartCon360 Takt Service",
     description="Takt planning, flowline visualization, and simulation",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -34,22 +33,27 @@ app.add_middleware(
 )
 
 
+# Constant probe payload, encoded once; async so probes skip the threadpool
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": "takt-service"})
+
+
 @app.get("/health")
-def health():
-    return {"status": "ok", "service": "takt-service"}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-# Mount takt-engine - it uses its own FastAPI app, mount it as sub-application
-from .modules.takt.main import app as takt_app
-app.mount("/takt-engine", takt_app)
+# Include each module's router directly (rather than mounting its FastAPI
+# app) so requests go through a single routing table and middleware stack.
+from .modules.takt.main import router as takt_router
+app.include_router(takt_router, prefix="/takt-engine", tags=["takt-engine"])
 
 # Mount flowline stub
 from .modules.flowline.router import router as flowline_router
 app.include_router(flowline_router, prefix="/api/v1/flowline", tags=["flowline"])
 
-# Mount simulation
-from .modules.simulation.main import app as simulation_app
-app.mount("/simulation-engine", simulation_app)
+# Simulation
+from .modules.simulation.main import router as simulation_router
+app.include_router(simulation_router, prefix="/simulation-engine")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,13 @@
 """Flowline module — stub for Phase 2 migration from Node.js."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+_HEALTH_BODY = orjson.dumps({"status": "stub", "module": "flowline"})
+
 
 @router.get("/health")
-def flowline_health():
-    return {"status": "stub", "module": "flowline"}
+async def flowline_health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
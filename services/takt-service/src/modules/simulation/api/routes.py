@@ -9,6 +9,7 @@ import logging
 import time
 
 from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from ..core.simulator import TaktSimulator
 from ..models.schemas import (
@@ -25,7 +26,9 @@ logger = logging.getLogger("simulation-service.routes")
 
 router = APIRouter(prefix="/simulate", tags=["simulation"])
 
-# Single shared simulator instance (stateless, so safe to reuse)
+# Single shared simulator instance (stateless, so safe to reuse).
+# Simulations are CPU-bound, so handlers run them on the threadpool to keep
+# the event loop free for other requests.
 _simulator = TaktSimulator()
 
 
@@ -46,15 +49,19 @@ _simulator = TaktSimulator()
 async def simulate_what_if(request: WhatIfRequest) -> APIResponse:
     try:
         start = time.perf_counter()
-        result: SimulationResult = _simulator.simulate_what_if(request)
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
-        logger.info(
-            "what-if simulation completed in %.1f ms  plan_id=%s  delta=%+d days",
-            elapsed_ms,
-            request.plan_id,
-            result.delta_days,
+        result: SimulationResult = await run_in_threadpool(
+            _simulator.simulate_what_if, request
         )
-        return APIResponse(data=result.model_dump())
+        # Skip building the log arguments when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(
+                "what-if simulation completed in %.1f ms  plan_id=%s  delta=%+d days",
+                elapsed_ms,
+                request.plan_id,
+                result.delta_days,
+            )
+        return APIResponse(data=result)
     except ValueError as exc:
         logger.warning("what-if validation error: %s", exc)
         return APIResponse(error=str(exc))
@@ -81,19 +88,22 @@ async def simulate_what_if(request: WhatIfRequest) -> APIResponse:
 async def simulate_monte_carlo(request: MonteCarloRequest) -> APIResponse:
     try:
         start = time.perf_counter()
-        result: MonteCarloResult = _simulator.simulate_monte_carlo(request)
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
-        logger.info(
-            "monte-carlo simulation completed in %.1f ms  plan_id=%s  "
-            "iterations=%d  p50=%s  p80=%s  p95=%s",
-            elapsed_ms,
-            request.plan_id,
-            request.iterations,
-            result.p50_end_date,
-            result.p80_end_date,
-            result.p95_end_date,
+        result: MonteCarloResult = await run_in_threadpool(
+            _simulator.simulate_monte_carlo, request
         )
-        return APIResponse(data=result.model_dump())
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(
+                "monte-carlo simulation completed in %.1f ms  plan_id=%s  "
+                "iterations=%d  p50=%s  p80=%s  p95=%s",
+                elapsed_ms,
+                request.plan_id,
+                request.iterations,
+                result.p50_end_date,
+                result.p80_end_date,
+                result.p95_end_date,
+            )
+        return APIResponse(data=result)
     except ValueError as exc:
         logger.warning("monte-carlo validation error: %s", exc)
         return APIResponse(error=str(exc))
@@ -119,17 +129,20 @@ async def simulate_monte_carlo(request: MonteCarloRequest) -> APIResponse:
 async def simulate_compare(request: CompareRequest) -> APIResponse:
     try:
         start = time.perf_counter()
-        result: CompareResult = _simulator.compare_scenarios(request)
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
-        logger.info(
-            "compare simulation completed in %.1f ms  plan_id=%s  "
-            "scenarios=%d  recommended=%d",
-            elapsed_ms,
-            request.plan_id,
-            len(request.scenarios),
-            result.recommendation_index,
+        result: CompareResult = await run_in_threadpool(
+            _simulator.compare_scenarios, request
         )
-        return APIResponse(data=result.model_dump())
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(
+                "compare simulation completed in %.1f ms  plan_id=%s  "
+                "scenarios=%d  recommended=%d",
+                elapsed_ms,
+                request.plan_id,
+                len(request.scenarios),
+                result.recommendation_index,
+            )
+        return APIResponse(data=result)
     except ValueError as exc:
         logger.warning("compare validation error: %s", exc)
         return APIResponse(error=str(exc))
@@ -17,8 +17,11 @@ from __future__ import annotations
 import copy
 import logging
 import math
-from collections import defaultdict
-from datetime import date, datetime, timedelta
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -48,47 +51,173 @@ logger = logging.getLogger("simulation-service.simulator")
 # Data structures used internally
 # ---------------------------------------------------------------------------
 
-class _Assignment:
-    """Represents a single trade-zone assignment in the takt grid."""
+@dataclass(slots=True)
+class _WagonState:
+    """Mutable working copy of a wagon while changes are applied."""
+
+    id: str
+    name: str
+    sequence: int
+    duration_days: int
+    crew_size: int
+    cost_per_day: float
+
+    @classmethod
+    def from_model(cls, wagon: Wagon) -> _WagonState:
+        return cls(
+            wagon.id,
+            wagon.name,
+            wagon.sequence,
+            wagon.duration_days,
+            wagon.crew_size,
+            wagon.cost_per_day,
+        )
+
+
+@dataclass(slots=True)
+class _ZoneState:
+    """Mutable working copy of a zone while changes are applied."""
+
+    id: str
+    name: str
+    sequence: int
+
+    @classmethod
+    def from_model(cls, zone: Zone) -> _ZoneState:
+        return cls(zone.id, zone.name, zone.sequence)
+
+
+def _writable(items: list[Any], state_cls: type[Any]) -> list[Any]:
+    """Return *items* as mutable working copies (copy-on-write).
+
+    Request models are shared until a change first writes to them; items
+    that are already working copies are kept as they are.
+    """
+    return [
+        item if isinstance(item, state_cls) else state_cls.from_model(item)
+        for item in items
+    ]
+
+
+class _Grid:
+    """A takt grid stored column-wise (struct of arrays).
+
+    Cell ``k`` is wagon ``wagon_idx[k]`` in zone ``zone_idx[k]``; cells are
+    kept in period order, so ``k`` is also the cell's takt period.  Start
+    and end are working-day indices (see the working-day arithmetic helpers)
+    and are only turned into dates when results are built.
+    """
 
     __slots__ = (
-        "wagon_id",
-        "wagon_name",
-        "zone_id",
-        "zone_name",
-        "period",
-        "start_date",
-        "end_date",
+        "wagon_ids",
+        "wagon_names",
+        "zone_ids",
+        "zone_names",
+        "wagon_idx",
+        "zone_idx",
+        "start_idx",
+        "end_idx",
         "duration_days",
+        "pattern",
+        "_dates",
     )
 
     def __init__(
         self,
-        wagon_id: str,
-        wagon_name: str,
-        zone_id: str,
-        zone_name: str,
-        period: int,
-        start_date: date,
-        end_date: date,
-        duration_days: int,
+        wagons: list[Wagon] | list[_WagonState],
+        zones: list[Zone] | list[_ZoneState],
+        start_idx: list[int],
+        end_idx: list[int],
+        pattern: tuple[tuple[int, ...], tuple[int, ...]] | None,
     ) -> None:
-        self.wagon_id = wagon_id
-        self.wagon_name = wagon_name
-        self.zone_id = zone_id
-        self.zone_name = zone_name
-        self.period = period
-        self.start_date = start_date
-        self.end_date = end_date
-        self.duration_days = duration_days
+        n_wagons = len(wagons)
+        n_zones = len(zones)
+        self.wagon_ids = [w.id for w in wagons]
+        self.wagon_names = [w.name for w in wagons]
+        self.zone_ids = [z.id for z in zones]
+        self.zone_names = [z.name for z in zones]
+        self.wagon_idx = np.repeat(np.arange(n_wagons, dtype=np.int32), n_zones)
+        self.zone_idx = np.tile(np.arange(n_zones, dtype=np.int32), n_wagons)
+        self.start_idx = np.array(start_idx, dtype=np.int64)
+        self.end_idx = np.array(end_idx, dtype=np.int64)
+        self.duration_days = np.repeat(
+            np.array([w.duration_days for w in wagons], dtype=np.int64), n_zones,
+        )
+        self.pattern = pattern
+        self._dates: dict[int, date] = {}
+
+    def __len__(self) -> int:
+        return len(self.start_idx)
+
+    def to_date(self, idx: int) -> date:
+        """Calendar date of working-day index *idx*."""
+        d = self._dates.get(idx)
+        if d is None:
+            d = self._dates[idx] = date.fromordinal(_nth_working_day(idx, self.pattern))
+        return d
+
+    def iso_dates(self, idx: np.ndarray) -> list[str]:
+        """ISO dates of an array of working-day indices.
+
+        Each distinct index is formatted once; grids repeat the same dates
+        across wagons and zones.
+        """
+        unique, inverse = np.unique(idx, return_inverse=True)
+        labels = [self.to_date(i).isoformat() for i in unique.tolist()]
+        return [labels[i] for i in inverse.tolist()]
+
+
+# ---------------------------------------------------------------------------
+# Working-day arithmetic
+# ---------------------------------------------------------------------------
+# Working days repeat weekly, so the n-th working day after any date can be
+# found with integer arithmetic on date ordinals instead of walking the
+# calendar one day at a time.  Ordinal 1 (0001-01-01) is a Monday, so the
+# weekday of ordinal ``o`` is ``(o - 1) % 7``.
+
+@lru_cache(maxsize=32)
+def _week_pattern(working_days: tuple[int, ...]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return (sorted working weekdays, working days up to each weekday)."""
+    weekdays = tuple(sorted({d for d in working_days if 0 <= d <= 6}))
+    if not weekdays:
+        raise ValueError("working_days must include at least one weekday (0-6).")
+    upto = tuple(sum(1 for d in weekdays if d <= wd) for wd in range(7))
+    return weekdays, upto
+
+
+def _working_days_through(ordinal: int, pattern: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    """Number of working days from ordinal 1 up to and including *ordinal*."""
+    weekdays, upto = pattern
+    weeks, weekday = divmod(ordinal - 1, 7)
+    return weeks * len(weekdays) + upto[weekday]
+
+
+def _nth_working_day(n: int, pattern: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    """Ordinal of the *n*-th working day (1-based) counted from ordinal 1."""
+    weekdays, _ = pattern
+    weeks, index = divmod(n - 1, len(weekdays))
+    return weeks * 7 + weekdays[index] + 1
 
 
 # ---------------------------------------------------------------------------
 # TaktSimulator
 # ---------------------------------------------------------------------------
 
+# Original (unmodified) grids kept per base plan; the UI typically runs
+# several what-ifs and a Monte Carlo against the same plan in a row.
+ORIGINAL_GRID_CACHE_SIZE = 64
+
+
 class TaktSimulator:
-    """Stateless simulation engine for takt plans."""
+    """Stateless simulation engine for takt plans.
+
+    The only state is a bounded memo of original grids keyed by the plan
+    contents, so results never depend on earlier requests.
+    """
+
+    def __init__(self) -> None:
+        self._grid_cache: OrderedDict[tuple, _Grid] = OrderedDict()
+        self._grid_cache_lock = threading.Lock()
 
     # -----------------------------------------------------------------
     # Public API
@@ -103,29 +232,77 @@ class TaktSimulator:
         4. Compare and return the delta.
         """
         base = request.base_plan
-        zones = [z.model_copy() for z in base.zones]
-        wagons = [w.model_copy() for w in base.wagons]
+        return self._run_what_if(base, request.changes, self._original_grid(base))
+
+    def _original_grid(self, base: BasePlan) -> _Grid:
+        """Return the unmodified takt grid of a base plan.
+
+        Grids are memoised on every plan field the grid depends on; the
+        returned grid is shared and must not be mutated.
+        """
+        key = (
+            tuple((z.id, z.name, z.sequence) for z in base.zones),
+            tuple((w.id, w.name, w.sequence, w.duration_days) for w in base.wagons),
+            base.takt_time,
+            base.start_date,
+            tuple(base.working_days),
+            base.buffer_days,
+        )
+        with self._grid_cache_lock:
+            grid = self._grid_cache.get(key)
+            if grid is not None:
+                self._grid_cache.move_to_end(key)
+                return grid
+
+        grid = self._recalculate_grid(
+            base.zones,
+            base.wagons,
+            base.takt_time,
+            self._parse_date(base.start_date),
+            base.working_days,
+            base.buffer_days,
+        )
+        with self._grid_cache_lock:
+            self._grid_cache[key] = grid
+            if len(self._grid_cache) > ORIGINAL_GRID_CACHE_SIZE:
+                self._grid_cache.popitem(last=False)
+        return grid
+
+    def _run_what_if(
+        self,
+        base: BasePlan,
+        changes: list[SimulationChange],
+        orig_grid: _Grid | None = None,
+    ) -> SimulationResult:
+        """Apply *changes* to *base* and compare against the original grid.
+
+        ``orig_grid`` lets callers simulating several scenarios on
+        the same plan compute the original grid once.
+        """
         takt_time = base.takt_time
         start_date = self._parse_date(base.start_date)
         working_days = base.working_days
         buffer_days = base.buffer_days
 
         # --- Original grid ---
-        orig_assignments = self._recalculate_grid(
-            zones, wagons, takt_time, start_date, working_days, buffer_days,
-        )
-        orig_end = self._grid_end_date(orig_assignments)
+        if orig_grid is None:
+            orig_grid = self._recalculate_grid(
+                base.zones, base.wagons, takt_time, start_date, working_days, buffer_days,
+            )
+        orig_end = self._grid_end_date(orig_grid)
 
         # --- Apply changes ---
-        sim_zones = [z.model_copy() for z in zones]
-        sim_wagons = [w.model_copy(deep=True) for w in wagons]
+        # The request models are shared until a change writes to them (see
+        # _writable), so e.g. delay_zone or add_buffer scenarios copy nothing
+        sim_zones: list[Zone] | list[_ZoneState] = base.zones
+        sim_wagons: list[Wagon] | list[_WagonState] = base.wagons
         sim_takt = takt_time
         sim_buffer = buffer_days
         zone_delays: dict[str, int] = {}
         resource_impacts: list[ResourceImpact] = []
         warnings: list[str] = []
 
-        for change in request.changes:
+        for change in changes:
             sim_zones, sim_wagons, sim_takt, sim_buffer, zone_delays, warnings = (
                 self._apply_change(
                     change,
@@ -140,7 +317,7 @@ class TaktSimulator:
             )
 
         # --- Simulated grid ---
-        sim_assignments = self._recalculate_grid(
+        sim_grid = self._recalculate_grid(
             sim_zones,
             sim_wagons,
             sim_takt,
@@ -149,22 +326,22 @@ class TaktSimulator:
             sim_buffer,
             zone_delays=zone_delays,
         )
-        sim_end = self._grid_end_date(sim_assignments)
+        sim_end = self._grid_end_date(sim_grid)
 
         # --- Stacking detection ---
-        stacking = self._detect_stacking(sim_assignments)
+        stacking = self._detect_stacking(sim_grid)
 
         # --- Metrics ---
         delta_days = (sim_end - orig_end).days
         cost_impact = self._compute_cost_impact(
-            orig_assignments, sim_assignments, wagons, sim_wagons,
+            orig_grid, sim_grid, base.wagons, sim_wagons,
         )
         risk_score = self._compute_risk_score(
             delta_days, len(stacking), len(sim_zones), len(sim_wagons),
         )
 
         # --- Flowline data ---
-        flowline_data = self._compute_flowline(sim_assignments, sim_zones)
+        flowline_data = self._compute_flowline(sim_grid, sim_zones)
 
         return SimulationResult(
             original_end_date=orig_end.isoformat(),
@@ -205,7 +382,10 @@ class TaktSimulator:
             dtype=np.float64,
         )  # shape: (n_wagons, n_zones)
 
-        rng = np.random.default_rng()
+        # A fresh generator per request keeps runs independent of each other
+        # (and safe across worker threads); PCG64DXSM is NumPy's faster
+        # successor to the default PCG64 and honours the optional seed.
+        rng = np.random.Generator(np.random.PCG64DXSM(request.seed))
 
         # Sample durations for all iterations at once: (n_iter, n_wagons, n_zones)
         std_dev = planned_durations * variance_pct
@@ -214,70 +394,35 @@ class TaktSimulator:
             scale=np.maximum(std_dev, 0.5),
             size=(n_iter, n_wagons, n_zones),
         )
-        # Truncate: minimum 1 day
-        sampled = np.maximum(sampled, 1.0)
-        sampled = np.ceil(sampled).astype(np.int64)
+        # Truncate: minimum 1 day (in place, the sample buffer is large)
+        np.maximum(sampled, 1.0, out=sampled)
+        np.ceil(sampled, out=sampled)
+        sampled = sampled.astype(np.int64)
 
-        # Inject random delay events
+        # Inject random delay events; amounts are drawn only for the cells
+        # that are actually delayed
         delay_mask = rng.random(size=(n_iter, n_wagons, n_zones)) < delay_prob
-        delay_amount = rng.integers(1, max(base.takt_time, 2) + 1, size=(n_iter, n_wagons, n_zones))
-        sampled += delay_mask.astype(np.int64) * delay_amount
+        sampled[delay_mask] += rng.integers(
+            1, max(base.takt_time, 2) + 1, size=int(np.count_nonzero(delay_mask)),
+        )
 
-        # For each iteration, compute the total project duration in working
-        # days using a vectorised forward-pass through the takt grid.
-        # finish[w][z] = max(finish[w-1][z], finish[w][z-1]) + duration[w][z] + buffer
+        # Forward pass through the takt grid for all iterations at once:
+        # finish[w][z] = max(finish[w-1][z] + buffer, finish[w][z-1]) + duration[w][z]
         # We track the critical-path contribution per wagon.
-
-        total_durations = np.empty(n_iter, dtype=np.int64)
-        critical_counts = np.zeros(n_wagons, dtype=np.int64)
-
-        for it in range(n_iter):
-            dur = sampled[it]  # (n_wagons, n_zones)
-            finish = np.zeros((n_wagons, n_zones), dtype=np.int64)
-            predecessor = np.zeros((n_wagons, n_zones), dtype=np.int8)
-            # predecessor: 0 = zone-predecessor, 1 = wagon-predecessor
-
-            for w in range(n_wagons):
-                for z in range(n_zones):
-                    prev_zone = finish[w][z - 1] if z > 0 else 0
-                    prev_wagon = (finish[w - 1][z] + buffer_days) if w > 0 else 0
-                    if prev_wagon > prev_zone:
-                        predecessor[w][z] = 1
-                    finish[w][z] = max(prev_zone, prev_wagon) + dur[w][z]
-
-            total_durations[it] = int(finish[-1, -1])
-
-            # Trace critical path backwards to identify critical wagons
-            w, z = n_wagons - 1, n_zones - 1
-            critical_set: set[int] = set()
-            while w >= 0 and z >= 0:
-                critical_set.add(w)
-                if w == 0 and z == 0:
-                    break
-                if z == 0:
-                    w -= 1
-                elif w == 0:
-                    z -= 1
-                elif predecessor[w][z] == 1:
-                    w -= 1
-                else:
-                    z -= 1
-            for cw in critical_set:
-                critical_counts[cw] += 1
+        total_durations, critical_counts = self._mc_forward_pass(sampled, buffer_days)
 
         # --- Deterministic baseline duration ---
-        det_assignments = self._recalculate_grid(
-            zones, wagons, base.takt_time, start_date, working_days, buffer_days,
-        )
-        det_end = self._grid_end_date(det_assignments)
+        det_grid = self._original_grid(base)
+        det_end = self._grid_end_date(det_grid)
         det_duration_days = self._working_days_between(start_date, det_end, working_days)
 
         # --- Statistics ---
         mean_dur = float(np.mean(total_durations))
         std_dur = float(np.std(total_durations))
-        p50 = int(np.percentile(total_durations, 50))
-        p80 = int(np.percentile(total_durations, 80))
-        p95 = int(np.percentile(total_durations, 95))
+        # One partition pass for all three percentiles
+        p50, p80, p95 = (
+            int(p) for p in np.percentile(total_durations, [50, 80, 95])
+        )
 
         on_time_count = int(np.sum(total_durations <= det_duration_days))
         on_time_prob = on_time_count / n_iter
@@ -314,16 +459,82 @@ class TaktSimulator:
             histogram=histogram,
         )
 
+    @staticmethod
+    def _mc_forward_pass(
+        sampled: np.ndarray, buffer_days: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute project durations and critical-path hits for every iteration.
+
+        ``sampled`` has shape ``(n_iter, n_wagons, n_zones)``.  The grid is
+        walked once cell by cell, with each cell updated for all iterations
+        as a vector, so the cost in Python is ``n_wagons * n_zones`` rather
+        than ``n_iter * n_wagons * n_zones``.
+
+        Returns ``(total_durations, critical_counts)`` where the latter
+        counts, per wagon, the iterations in which it lies on the critical
+        path.
+        """
+        n_iter, n_wagons, n_zones = sampled.shape
+        durations = np.ascontiguousarray(sampled.transpose(1, 2, 0))  # (w, z, iter)
+
+        prev_row = np.zeros((n_zones, n_iter), dtype=np.int64)
+        cur_row = np.zeros((n_zones, n_iter), dtype=np.int64)
+        # from_wagon[w, z]: the cell was driven by the preceding wagon
+        # (otherwise by the preceding zone of the same wagon).
+        from_wagon = np.zeros((n_wagons, n_zones, n_iter), dtype=bool)
+
+        for w in range(n_wagons):
+            for z in range(n_zones):
+                if w > 0:
+                    prev_wagon = prev_row[z] + buffer_days
+                    if z > 0:
+                        prev_zone = cur_row[z - 1]
+                        np.greater(prev_wagon, prev_zone, out=from_wagon[w, z])
+                        np.maximum(prev_wagon, prev_zone, out=cur_row[z])
+                    else:
+                        from_wagon[w, z] = prev_wagon > 0
+                        np.maximum(prev_wagon, 0, out=cur_row[z])
+                elif z > 0:
+                    cur_row[z] = cur_row[z - 1]
+                else:
+                    cur_row[z] = 0
+                cur_row[z] += durations[w, z]
+            prev_row, cur_row = cur_row, prev_row
+
+        total_durations = prev_row[-1].copy()
+
+        # Trace the critical path backwards for all iterations in lockstep.
+        # Every step moves back one wagon or one zone, so each path reaches
+        # cell (0, 0) after exactly n_wagons + n_zones - 2 steps.  Flat views
+        # keep every step to one 1-D gather and one scatter.
+        iters = np.arange(n_iter)
+        w = np.full(n_iter, n_wagons - 1, dtype=np.int64)
+        z = np.full(n_iter, n_zones - 1, dtype=np.int64)
+        from_wagon_flat = from_wagon.reshape(-1)
+        on_path = np.zeros((n_iter, n_wagons), dtype=bool)
+        on_path_flat = on_path.reshape(-1)
+        path_row = iters * n_wagons
+        on_path_flat[path_row + w] = True
+        for _ in range(n_wagons + n_zones - 2):
+            step_wagon = (z == 0) | (
+                (w > 0) & from_wagon_flat[(w * n_zones + z) * n_iter + iters]
+            )
+            w -= step_wagon
+            z -= ~step_wagon
+            on_path_flat[path_row + w] = True
+
+        return total_durations, on_path.sum(axis=0)
+
     def compare_scenarios(self, request: CompareRequest) -> CompareResult:
         """Compare multiple what-if scenarios and recommend the best one."""
-        results: list[SimulationResult] = []
-        for scenario_changes in request.scenarios:
-            what_if = WhatIfRequest(
-                plan_id=request.plan_id,
-                base_plan=request.base_plan,
-                changes=scenario_changes,
-            )
-            results.append(self.simulate_what_if(what_if))
+        # Every scenario starts from the same plan, so the original grid is
+        # shared rather than recomputed per scenario
+        base = request.base_plan
+        orig_grid = self._original_grid(base)
+        results: list[SimulationResult] = [
+            self._run_what_if(base, scenario_changes, orig_grid)
+            for scenario_changes in request.scenarios
+        ]
 
         # Score each scenario: lower is better.
         # score = risk_adjusted_delta + stacking_penalty
@@ -384,15 +595,15 @@ class TaktSimulator:
 
     def _recalculate_grid(
         self,
-        zones: list[Zone],
-        wagons: list[Wagon],
+        zones: list[Zone] | list[_ZoneState],
+        wagons: list[Wagon] | list[_WagonState],
         takt_time: int,
         start_date: date,
         working_days: list[int],
         buffer_days: int = 0,
         zone_delays: dict[str, int] | None = None,
-    ) -> list[_Assignment]:
-        """Compute the full takt grid returning a list of assignments.
+    ) -> _Grid:
+        """Compute the full takt grid.
 
         The grid follows standard takt-train logic:
           - Wagons are sorted by sequence.
@@ -407,115 +618,125 @@ class TaktSimulator:
         sorted_wagons = sorted(wagons, key=lambda w: w.sequence)
 
         if not sorted_zones or not sorted_wagons:
-            return []
+            return _Grid([], [], [], [], None)
 
         zone_delays = zone_delays or {}
 
         n_wagons = len(sorted_wagons)
         n_zones = len(sorted_zones)
 
-        # finish_date[w][z] stores the end date of wagon w in zone z.
-        finish_date: list[list[date | None]] = [
-            [None] * n_zones for _ in range(n_wagons)
-        ]
-
-        assignments: list[_Assignment] = []
-        period_counter = 0
+        # Cells are scheduled in working-day indices (see the working-day
+        # arithmetic helpers): the n-th working day after index i is i + n,
+        # so the loop is integer maths and dates are only built for results.
+        pattern = _week_pattern(tuple(working_days))
+        # Index of the first working day on or after the project start
+        start_idx = _working_days_through(start_date.toordinal() - 1, pattern) + 1
+        wagon_gap = max(buffer_days + 1, 0)
+        # Zone delays are resolved once per zone instead of once per cell.
+        delays = [max(zone_delays.get(zone.id, 0), 0) for zone in sorted_zones]
+
+        # finish_idx[z] holds the end index of the previous wagon in zone z
+        # until the current wagon overwrites it.
+        finish_idx: list[int] = [0] * n_zones
+        starts: list[int] = []
+        ends: list[int] = []
 
         for w_idx, wagon in enumerate(sorted_wagons):
-            for z_idx, zone in enumerate(sorted_zones):
+            # Duration for this wagon (may differ from takt_time if
+            # the wagon has its own duration_days, e.g. after add_crew).
+            span = max(wagon.duration_days - 1, 0)
+            # (a) applies from the second wagon on
+            gap = wagon_gap if w_idx > 0 else None
+            prev_end = None
+            for z_idx, zone_delay in enumerate(delays):
                 # Determine earliest start for this cell
-                earliest = start_date
+                earliest = start_idx
 
                 # (a) Must wait for previous wagon to finish this zone + buffer
-                if w_idx > 0 and finish_date[w_idx - 1][z_idx] is not None:
-                    prev_wagon_end = finish_date[w_idx - 1][z_idx]
-                    assert prev_wagon_end is not None
-                    earliest_after_prev_wagon = self._add_working_days(
-                        prev_wagon_end, buffer_days + 1, working_days,
-                    )
-                    if earliest_after_prev_wagon > earliest:
-                        earliest = earliest_after_prev_wagon
+                if gap is not None:
+                    earliest = max(earliest, finish_idx[z_idx] + gap)
 
                 # (b) Must wait for this wagon to finish the previous zone
-                if z_idx > 0 and finish_date[w_idx][z_idx - 1] is not None:
-                    prev_zone_end = finish_date[w_idx][z_idx - 1]
-                    assert prev_zone_end is not None
-                    earliest_after_prev_zone = self._add_working_days(
-                        prev_zone_end, 1, working_days,
-                    )
-                    if earliest_after_prev_zone > earliest:
-                        earliest = earliest_after_prev_zone
+                if prev_end is not None:
+                    earliest = max(earliest, prev_end + 1)
 
                 # Zone-specific delay
-                zone_delay = zone_delays.get(zone.id, 0)
-                if zone_delay > 0:
-                    earliest = self._add_working_days(earliest, zone_delay, working_days)
-
-                # Ensure start falls on a working day
-                earliest = self._next_working_day(earliest, working_days)
-
-                # Duration for this wagon (may differ from takt_time if
-                # the wagon has its own duration_days, e.g. after add_crew).
-                duration = wagon.duration_days
-
-                # Compute end date
-                end = self._add_working_days(earliest, duration - 1, working_days)
-
-                finish_date[w_idx][z_idx] = end
-
-                assignment = _Assignment(
-                    wagon_id=wagon.id,
-                    wagon_name=wagon.name,
-                    zone_id=zone.id,
-                    zone_name=zone.name,
-                    period=period_counter,
-                    start_date=earliest,
-                    end_date=end,
-                    duration_days=duration,
-                )
-                assignments.append(assignment)
-                period_counter += 1
+                earliest += zone_delay
 
-        return assignments
+                end = earliest + span
+                finish_idx[z_idx] = prev_end = end
+                starts.append(earliest)
+                ends.append(end)
+
+        return _Grid(sorted_wagons, sorted_zones, starts, ends, pattern)
 
     # -----------------------------------------------------------------
     # Stacking detection
     # -----------------------------------------------------------------
 
-    def _detect_stacking(self, assignments: list[_Assignment]) -> list[TradeStacking]:
+    def _detect_stacking(self, grid: _Grid) -> list[TradeStacking]:
         """Find trade-stacking conflicts: multiple wagons in the same zone
         at the same time."""
-        # Group by zone
-        zone_assignments: dict[str, list[_Assignment]] = defaultdict(list)
-        for a in assignments:
-            zone_assignments[a.zone_id].append(a)
-
-        conflicts: list[TradeStacking] = []
-
-        for zone_id, zone_asgns in zone_assignments.items():
-            n = len(zone_asgns)
-            for i in range(n):
-                for j in range(i + 1, n):
-                    a = zone_asgns[i]
-                    b = zone_asgns[j]
-                    # Check date overlap
-                    if a.start_date <= b.end_date and b.start_date <= a.end_date:
-                        # Overlap detected
-                        overlap_start = max(a.start_date, b.start_date)
-                        overlap_end = min(a.end_date, b.end_date)
-                        conflicts.append(
-                            TradeStacking(
-                                zone_id=zone_id,
-                                zone_name=a.zone_name,
-                                period=min(a.period, b.period),
-                                trades=[a.wagon_name, b.wagon_name],
-                                start_date=overlap_start.isoformat(),
-                                end_date=overlap_end.isoformat(),
-                            )
-                        )
-
-        return conflicts
+        if not len(grid):
+            return []
+
+        # Group cells by zone id (zones sharing an id form one group), in
+        # order of first appearance; a stable sort keeps period order
+        # within each group.
+        first_pos: dict[str, int] = {}
+        for pos, zone_id in enumerate(grid.zone_ids):
+            first_pos.setdefault(zone_id, pos)
+        zone_key = np.array([first_pos[z] for z in grid.zone_ids])[grid.zone_idx]
+        order = np.argsort(zone_key, kind="stable")
+        bounds = np.flatnonzero(np.diff(zone_key[order])) + 1
+
+        # Overlapping cell pairs (first, second), by zone then period order
+        firsts: list[np.ndarray] = []
+        seconds: list[np.ndarray] = []
+        for cells in np.split(order, bounds):
+            if len(cells) < 2:
+                # A zone worked by a single wagon cannot stack
+                continue
+            start = grid.start_idx[cells]
+            end = grid.end_idx[cells]
+            # Pairwise date overlap within the zone; the upper triangle gives
+            # each pair once, in period order
+            overlap = (start[:, None] <= end[None, :]) & (start[None, :] <= end[:, None])
+            rows, cols = np.nonzero(np.triu(overlap, k=1))
+            firsts.append(cells[rows])
+            seconds.append(cells[cols])
+
+        if not firsts:
+            return []
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        if not len(first):
+            return []
+        overlap_starts = grid.iso_dates(
+            np.maximum(grid.start_idx[first], grid.start_idx[second])
+        )
+        overlap_ends = grid.iso_dates(
+            np.minimum(grid.end_idx[first], grid.end_idx[second])
+        )
+
+        zone_ids = grid.zone_ids
+        zone_names = grid.zone_names
+        wagon_names = grid.wagon_names
+        zone_idx = grid.zone_idx.tolist()
+        wagon_idx = grid.wagon_idx.tolist()
+        return [
+            TradeStacking(
+                zone_id=zone_ids[zone_idx[a]],
+                zone_name=zone_names[zone_idx[a]],
+                period=a,
+                trades=[wagon_names[wagon_idx[a]], wagon_names[wagon_idx[b]]],
+                start_date=overlap_start,
+                end_date=overlap_end,
+            )
+            for a, b, overlap_start, overlap_end in zip(
+                first.tolist(), second.tolist(), overlap_starts, overlap_ends,
+            )
+        ]
 
     # -----------------------------------------------------------------
     # Change application
@@ -524,27 +745,32 @@ class TaktSimulator:
     def _apply_change(
         self,
         change: SimulationChange,
-        zones: list[Zone],
-        wagons: list[Wagon],
+        zones: list[Zone] | list[_ZoneState],
+        wagons: list[Wagon] | list[_WagonState],
         takt_time: int,
         buffer_days: int,
         zone_delays: dict[str, int],
         resource_impacts: list[ResourceImpact],
         warnings: list[str],
     ) -> tuple[
-        list[Zone],
-        list[Wagon],
+        list[Zone] | list[_ZoneState],
+        list[Wagon] | list[_WagonState],
         int,
         int,
         dict[str, int],
         list[str],
     ]:
-        """Apply a single SimulationChange and return updated plan components."""
+        """Apply a single SimulationChange and return updated plan components.
+
+        Handlers that modify zones or wagons first take working copies with
+        _writable; the lists passed in are never mutated.
+        """
         params = change.parameters
 
         if change.type == ChangeType.add_crew:
             trade_id = params.get("trade_id", "")
             additional = int(params.get("additional_crew", 1))
+            wagons = _writable(wagons, _WagonState)
             wagon = self._find_wagon(wagons, trade_id)
             if wagon is None:
                 warnings.append(f"add_crew: trade '{trade_id}' not found, skipping.")
@@ -571,15 +797,20 @@ class TaktSimulator:
             if new_takt < 1:
                 warnings.append("change_takt_time: value must be >= 1, using 1.")
                 new_takt = 1
-            # Update all wagon durations proportionally to new takt
+            # Update all wagon durations proportionally to new takt, in one
+            # vectorised pass (np.rint rounds half to even, like round())
             ratio = new_takt / takt_time if takt_time > 0 else 1
-            for w in wagons:
-                w.duration_days = max(1, round(w.duration_days * ratio))
+            wagons = _writable(wagons, _WagonState)
+            durations = np.array([w.duration_days for w in wagons], dtype=np.float64)
+            scaled = np.maximum(np.rint(durations * ratio), 1).astype(np.int64)
+            for w, duration in zip(wagons, scaled.tolist()):
+                w.duration_days = duration
             takt_time = new_takt
 
         elif change.type == ChangeType.move_trade:
             trade_id = params.get("trade_id", "")
             new_seq = int(params.get("new_sequence", 0))
+            wagons = _writable(wagons, _WagonState)
             wagon = self._find_wagon(wagons, trade_id)
             if wagon is None:
                 warnings.append(f"move_trade: trade '{trade_id}' not found, skipping.")
@@ -630,7 +861,9 @@ class TaktSimulator:
                 warnings.append(f"remove_trade: trade '{trade_id}' not found, skipping.")
             else:
                 removed_seq = wagon.sequence
-                wagons = [w for w in wagons if w.id != trade_id]
+                wagons = _writable(
+                    [w for w in wagons if w.id != trade_id], _WagonState,
+                )
                 # Re-compact sequences
                 for w in wagons:
                     if w.sequence > removed_seq:
@@ -648,7 +881,9 @@ class TaktSimulator:
                 )
             else:
                 original_seq = zone.sequence
-                zones = [z for z in zones if z.id != zone_id]
+                zones = _writable(
+                    [z for z in zones if z.id != zone_id], _ZoneState,
+                )
                 # Shift sequences of zones after the split point
                 n_new = len(split_names)
                 for z in zones:
@@ -656,7 +891,7 @@ class TaktSimulator:
                         z.sequence += n_new - 1
                 # Insert new zones
                 for i, name in enumerate(split_names):
-                    new_zone = Zone(
+                    new_zone = _ZoneState(
                         id=f"{zone_id}_split_{i}",
                         name=name,
                         sequence=original_seq + i,
@@ -672,8 +907,8 @@ class TaktSimulator:
 
     def _compute_flowline(
         self,
-        assignments: list[_Assignment],
-        zones: list[Zone],
+        grid: _Grid,
+        zones: list[Zone] | list[_ZoneState],
     ) -> dict[str, Any]:
         """Generate flowline visualization data.
 
@@ -693,14 +928,21 @@ class TaktSimulator:
         zone_names = [z.name for z in sorted_zones]
 
         trades: dict[str, list[dict[str, str]]] = defaultdict(list)
-        for a in assignments:
-            trades[a.wagon_name].append(
+        cells = zip(
+            grid.wagon_idx.tolist(),
+            grid.zone_idx.tolist(),
+            grid.iso_dates(grid.start_idx),
+            grid.iso_dates(grid.end_idx),
+            grid.duration_days.tolist(),
+        )
+        for w_idx, z_idx, start, end, duration in cells:
+            trades[grid.wagon_names[w_idx]].append(
                 {
-                    "zone": a.zone_name,
-                    "zone_id": a.zone_id,
-                    "start": a.start_date.isoformat(),
-                    "end": a.end_date.isoformat(),
-                    "duration_days": a.duration_days,
+                    "zone": grid.zone_names[z_idx],
+                    "zone_id": grid.zone_ids[z_idx],
+                    "start": start,
+                    "end": end,
+                    "duration_days": duration,
                 }
             )
 
@@ -715,32 +957,31 @@ class TaktSimulator:
 
     def _compute_cost_impact(
         self,
-        orig_assignments: list[_Assignment],
-        sim_assignments: list[_Assignment],
+        orig_grid: _Grid,
+        sim_grid: _Grid,
         orig_wagons: list[Wagon],
-        sim_wagons: list[Wagon],
+        sim_wagons: list[Wagon] | list[_WagonState],
     ) -> float:
         """Compute cost impact as delta(total crew-days * cost_per_day).
 
         Positive = more expensive than the original plan.
         """
-        orig_cost = self._total_cost(orig_assignments, orig_wagons)
-        sim_cost = self._total_cost(sim_assignments, sim_wagons)
+        orig_cost = self._total_cost(orig_grid, orig_wagons)
+        sim_cost = self._total_cost(sim_grid, sim_wagons)
         return sim_cost - orig_cost
 
     def _total_cost(
         self,
-        assignments: list[_Assignment],
-        wagons: list[Wagon],
+        grid: _Grid,
+        wagons: list[Wagon] | list[_WagonState],
     ) -> float:
         cost_map: dict[str, float] = {w.id: w.cost_per_day for w in wagons}
         crew_map: dict[str, int] = {w.id: w.crew_size for w in wagons}
-        total = 0.0
-        for a in assignments:
-            cpd = cost_map.get(a.wagon_id, 0.0)
-            crew = crew_map.get(a.wagon_id, 1)
-            total += a.duration_days * cpd * crew
-        return total
+        # Rates are looked up once per grid wagon and gathered per cell
+        cpd = np.array([cost_map.get(i, 0.0) for i in grid.wagon_ids], dtype=np.float64)
+        crew = np.array([crew_map.get(i, 1) for i in grid.wagon_ids], dtype=np.float64)
+        idx = grid.wagon_idx
+        return float((grid.duration_days * cpd[idx] * crew[idx]).sum())
 
     def _compute_risk_score(
         self,
@@ -776,14 +1017,23 @@ class TaktSimulator:
     def _parse_date(value: str | date) -> date:
         if isinstance(value, date):
             return value
-        return parse_date(str(value)).date()
+        value = str(value)
+        # Plans carry ISO dates; only fall back to dateutil for other formats
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return parse_date(value).date()
 
     @staticmethod
     def _next_working_day(d: date, working_days: list[int]) -> date:
         """Advance *d* to the next working day if it falls on a non-working day."""
-        while d.weekday() not in working_days:
-            d += timedelta(days=1)
-        return d
+        if d.weekday() in working_days:
+            return d
+        pattern = _week_pattern(tuple(working_days))
+        ordinal = d.toordinal()
+        return date.fromordinal(
+            _nth_working_day(_working_days_through(ordinal, pattern) + 1, pattern)
+        )
 
     @staticmethod
     def _add_working_days(start: date, days: int, working_days: list[int]) -> date:
@@ -791,36 +1041,29 @@ class TaktSimulator:
         a working day and days >= 1)."""
         if days <= 0:
             return start
-        current = start
-        # Ensure we start on a working day
-        while current.weekday() not in working_days:
-            current += timedelta(days=1)
-        added = 0
-        while added < days:
-            current += timedelta(days=1)
-            if current.weekday() in working_days:
-                added += 1
-        return current
+        pattern = _week_pattern(tuple(working_days))
+        # Counting from the first working day on or after start is the same
+        # as counting from the last working day before it, plus one
+        before_start = _working_days_through(start.toordinal() - 1, pattern)
+        return date.fromordinal(_nth_working_day(before_start + 1 + days, pattern))
 
     @staticmethod
     def _working_days_between(start: date, end: date, working_days: list[int]) -> int:
         """Count working days between start (inclusive) and end (inclusive)."""
         if end < start:
             return 0
-        count = 0
-        current = start
-        while current <= end:
-            if current.weekday() in working_days:
-                count += 1
-            current += timedelta(days=1)
-        return count
+        pattern = _week_pattern(tuple(working_days))
+        return (
+            _working_days_through(end.toordinal(), pattern)
+            - _working_days_through(start.toordinal() - 1, pattern)
+        )
 
     @staticmethod
-    def _grid_end_date(assignments: list[_Assignment]) -> date:
-        """Return the latest end date in the assignment list."""
-        if not assignments:
+    def _grid_end_date(grid: _Grid) -> date:
+        """Return the latest end date in the grid."""
+        if not len(grid):
             return date.today()
-        return max(a.end_date for a in assignments)
+        return grid.to_date(int(grid.end_idx.max()))
 
     # -----------------------------------------------------------------
     # Histogram builder
@@ -831,31 +1074,34 @@ class TaktSimulator:
         """Build histogram bins from an array of durations."""
         counts, edges = np.histogram(data, bins=bins)
         total = int(np.sum(counts))
-        result: list[HistogramBin] = []
-        for i in range(len(counts)):
-            result.append(
-                HistogramBin(
-                    min_days=round(float(edges[i]), 2),
-                    max_days=round(float(edges[i + 1]), 2),
-                    count=int(counts[i]),
-                    frequency=round(int(counts[i]) / total, 6) if total > 0 else 0.0,
-                )
+        edge_list = edges.tolist()
+        return [
+            HistogramBin(
+                min_days=round(edge_list[i], 2),
+                max_days=round(edge_list[i + 1], 2),
+                count=count,
+                frequency=round(count / total, 6) if total > 0 else 0.0,
             )
-        return result
+            for i, count in enumerate(counts.tolist())
+        ]
 
     # -----------------------------------------------------------------
     # Lookup helpers
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _find_wagon(wagons: list[Wagon], wagon_id: str) -> Wagon | None:
+    def _find_wagon(
+        wagons: list[Wagon] | list[_WagonState], wagon_id: str,
+    ) -> Wagon | _WagonState | None:
         for w in wagons:
             if w.id == wagon_id:
                 return w
         return None
 
     @staticmethod
-    def _find_zone(zones: list[Zone], zone_id: str) -> Zone | None:
+    def _find_zone(
+        zones: list[Zone] | list[_ZoneState], zone_id: str,
+    ) -> Zone | _ZoneState | None:
         for z in zones:
             if z.id == zone_id:
                 return z
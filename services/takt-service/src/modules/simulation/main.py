@@ -12,8 +12,10 @@ from __future__ import annotations
 import logging
 import os
 
-from fastapi import FastAPI
+import orjson
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import router as simulation_router
 
@@ -43,6 +45,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # ---------------------------------------------------------------------------
@@ -66,16 +69,25 @@ app.add_middleware(
 # Routes
 # ---------------------------------------------------------------------------
 
-app.include_router(simulation_router, prefix="/api/v1")
+# All endpoints hang off one router so the takt-service aggregator can include
+# them directly instead of mounting this app.
+router = APIRouter()
+router.include_router(simulation_router, prefix="/api/v1")
 
 
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
 
-@app.get("/health", tags=["health"])
-async def health_check() -> dict[str, str]:
-    return {"status": "healthy", "service": "simulation-service"}
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "simulation-service"})
+
+
+@router.get("/health", tags=["health"])
+async def health_check() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+app.include_router(router)
 
 
 # ---------------------------------------------------------------------------
@@ -174,6 +174,11 @@ class MonteCarloRequest(BaseModel):
         le=1.0,
         description="Probability that any trade-zone pair experiences an extra delay.",
     )
+    seed: int | None = Field(
+        default=None,
+        ge=0,
+        description="Random seed for reproducible runs; omit for a fresh random stream.",
+    )
 
 
 class HistogramBin(BaseModel):
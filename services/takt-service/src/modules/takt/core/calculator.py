@@ -4,7 +4,7 @@ from datetime import date, timedelta
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneInput:
     id: str
     name: str
@@ -12,7 +12,7 @@ class ZoneInput:
     area_sqm: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WagonInput:
     id: str
     trade_id: str
@@ -21,7 +21,7 @@ class WagonInput:
     buffer_after: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     zone_id: str
     wagon_id: str
@@ -47,16 +47,47 @@ def add_working_days(start: date, days: int, working_days: list[int] | None = No
     """
     if working_days is None:
         working_days = [0, 1, 2, 3, 4]  # Mon-Fri
+    # Bit d is set when weekday d is worked; tested with a shift per day
+    mask = 0
+    for d in working_days:
+        if 0 <= d <= 6:
+            mask |= 1 << d
     
     current = start
+    weekday = start.weekday()
+    one_day = timedelta(days=1)
     added = 0
     while added < days:
-        current += timedelta(days=1)
-        if current.weekday() in working_days:
+        current += one_day
+        weekday = (weekday + 1) % 7
+        if mask >> weekday & 1:
             added += 1
     return current
 
 
+def working_day_calendar(
+    start: date, days: int, working_days: list[int] | None = None,
+) -> list[date]:
+    """Return ``[add_working_days(start, n) for n in range(days + 1)]``.
+    
+    Built in a single walk over the calendar.
+    """
+    if working_days is None:
+        working_days = [0, 1, 2, 3, 4]  # Mon-Fri
+    is_working = [d in working_days for d in range(7)]
+    
+    calendar = [start]
+    current = start
+    weekday = start.weekday()
+    one_day = timedelta(days=1)
+    while len(calendar) <= days:
+        current += one_day
+        weekday = (weekday + 1) % 7
+        if is_working[weekday]:
+            calendar.append(current)
+    return calendar
+
+
 def generate_takt_grid(
     zones: list[ZoneInput],
     wagons: list[WagonInput],
@@ -87,6 +118,17 @@ def generate_takt_grid(
             buffer_offsets[i - 1] + sorted_wagons[i - 1].buffer_after
         )
     
+    # Working-day calendar covering the latest end date in the grid, so each
+    # cell is two index lookups instead of two day-by-day walks.
+    max_end_offset = 0
+    if sorted_zones and sorted_wagons:
+        max_end_offset = max(
+            (sorted_zones[-1].sequence + i + buffer_offsets[i] - 1) * takt_time
+            + max(wagon.duration_days - 1, 0)
+            for i, wagon in enumerate(sorted_wagons)
+        )
+    calendar = working_day_calendar(start_date, max_end_offset, working_days)
+    
     assignments: list[Assignment] = []
     
     for zone in sorted_zones:
@@ -96,8 +138,11 @@ def generate_takt_grid(
             
             # Calculate dates
             days_offset = (period - 1) * takt_time
-            planned_start = add_working_days(start_date, days_offset, working_days)
-            planned_end = add_working_days(planned_start, wagon.duration_days - 1, working_days)
+            planned_start = calendar[days_offset]
+            # Counting duration_days - 1 working days on from planned_start
+            # is the same calendar slot whether or not start_date is a
+            # working day
+            planned_end = calendar[max(days_offset + wagon.duration_days - 1, days_offset)]
             
             assignments.append(Assignment(
                 zone_id=zone.id,
@@ -126,19 +171,34 @@ def detect_trade_stacking(
         zone_assignments.setdefault(a.zone_id, []).append(a)
     
     for zone_id, zone_assigns in zone_assignments.items():
-        for i, a1 in enumerate(zone_assigns):
-            for a2 in zone_assigns[i + 1:]:
+        # Sweep in start-date order: once a later assignment starts after the
+        # current one ends, no further assignment can overlap it. Pairs are
+        # then reported in input order.
+        by_start = sorted(range(len(zone_assigns)), key=lambda k: zone_assigns[k].planned_start)
+        pairs: list[tuple[int, int]] = []
+        for pos, k in enumerate(by_start):
+            current = zone_assigns[k]
+            for next_pos in range(pos + 1, len(by_start)):
+                m = by_start[next_pos]
+                other = zone_assigns[m]
+                if other.planned_start > current.planned_end:
+                    break
                 # Check date overlap
-                if a1.planned_start <= a2.planned_end and a2.planned_start <= a1.planned_end:
-                    conflicts.append({
-                        "zone_id": zone_id,
-                        "wagon_1": a1.wagon_id,
-                        "wagon_2": a2.wagon_id,
-                        "period_1": a1.period_number,
-                        "period_2": a2.period_number,
-                        "overlap_start": max(a1.planned_start, a2.planned_start).isoformat(),
-                        "overlap_end": min(a1.planned_end, a2.planned_end).isoformat(),
-                    })
+                if current.planned_start <= other.planned_end:
+                    pairs.append((k, m) if k < m else (m, k))
+        pairs.sort()
+        
+        for i, j in pairs:
+            a1, a2 = zone_assigns[i], zone_assigns[j]
+            conflicts.append({
+                "zone_id": zone_id,
+                "wagon_1": a1.wagon_id,
+                "wagon_2": a2.wagon_id,
+                "period_1": a1.period_number,
+                "period_2": a2.period_number,
+                "overlap_start": max(a1.planned_start, a2.planned_start).isoformat(),
+                "overlap_end": min(a1.planned_end, a2.planned_end).isoformat(),
+            })
     
     return conflicts
 
@@ -164,10 +224,16 @@ def compute_flowline_data(
     
     zone_seq_map = {z.id: z.sequence - 1 for z in sorted_zones}
     
+    # Group assignments by wagon in a single pass instead of rescanning the
+    # full grid once per wagon.
+    assigns_by_wagon: dict[str, list[Assignment]] = {}
+    for a in assignments:
+        assigns_by_wagon.setdefault(a.wagon_id, []).append(a)
+    
     wagon_data = []
     for wagon in sorted(wagons, key=lambda w: w.sequence):
         segments = []
-        wagon_assigns = [a for a in assignments if a.wagon_id == wagon.id]
+        wagon_assigns = assigns_by_wagon.get(wagon.id, [])
         wagon_assigns.sort(key=lambda a: a.period_number)
         
         for a in wagon_assigns:
@@ -4,13 +4,16 @@ Stateless computation service. All persistence is handled by core-service.
 This service only receives data, computes, and returns results.
 """
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from datetime import date
 from typing import Optional
 import logging
 
+import orjson
+
 from .core.calculator import (
     ZoneInput, WagonInput as WagonCalcInput,
     generate_takt_grid, detect_trade_stacking,
@@ -20,7 +23,11 @@ from .core.calculator import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("takt-engine")
 
-app = FastAPI(title="TaktFlow AI — Takt Engine (Stateless Compute)", version="2.0.0")
+app = FastAPI(
+    title="TaktFlow AI — Takt Engine (Stateless Compute)",
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -29,6 +36,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Endpoints live on a router so the takt-service aggregator can include them
+# directly; ``app`` wraps the same router for standalone use.
+router = APIRouter()
+
 
 # ── Request/Response Models ──
 
@@ -73,21 +84,32 @@ class FlowlineRequest(BaseModel):
     start_date: date
 
 
+def _to_calc_inputs(
+    zones: list[ZoneInputModel], wagons: list[WagonInputModel],
+) -> tuple[list[ZoneInput], list[WagonCalcInput]]:
+    """Convert validated request models into calculator inputs in one pass each."""
+    return (
+        [ZoneInput(z.id, z.name, z.sequence) for z in zones],
+        [WagonCalcInput(w.id, w.trade_id, w.sequence, w.duration_days, w.buffer_after) for w in wagons],
+    )
+
+
 # ── Endpoints ──
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "takt-engine", "mode": "stateless-compute"}
+_HEALTH_BODY = orjson.dumps(
+    {"status": "ok", "service": "takt-engine", "mode": "stateless-compute"}
+)
+
+
+@router.get("/health")
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.post("/takt/compute/grid")
+@router.post("/takt/compute/grid")
 def compute_grid(req: ComputeGridRequest):
     """Compute takt grid assignments. Returns computed data without persisting."""
-    zones = [ZoneInput(id=z.id, name=z.name, sequence=z.sequence) for z in req.zones]
-    wagons = [WagonCalcInput(
-        id=w.id, trade_id=w.trade_id, sequence=w.sequence,
-        duration_days=w.duration_days, buffer_after=w.buffer_after,
-    ) for w in req.wagons]
+    zones, wagons = _to_calc_inputs(req.zones, req.wagons)
 
     assignments = generate_takt_grid(zones, wagons, req.start_date, req.takt_time)
     total_periods = calculate_total_periods(len(zones), len(wagons), req.buffer_size)
@@ -119,14 +141,10 @@ def compute_grid(req: ComputeGridRequest):
     }
 
 
-@app.post("/takt/compute/validate")
+@router.post("/takt/compute/validate")
 def validate_grid(req: ValidateRequest):
     """Validate a takt grid for trade stacking and conflicts."""
-    zones = [ZoneInput(id=z.id, name=z.name, sequence=z.sequence) for z in req.zones]
-    wagons = [WagonCalcInput(
-        id=w.id, trade_id=w.trade_id, sequence=w.sequence,
-        duration_days=w.duration_days, buffer_after=w.buffer_after,
-    ) for w in req.wagons]
+    zones, wagons = _to_calc_inputs(req.zones, req.wagons)
 
     assignments = generate_takt_grid(zones, wagons, req.start_date, req.takt_time)
     stacking = detect_trade_stacking(assignments)
@@ -141,14 +159,10 @@ def validate_grid(req: ValidateRequest):
     }
 
 
-@app.post("/takt/compute/flowline")
+@router.post("/takt/compute/flowline")
 def compute_flowline(req: FlowlineRequest):
     """Compute flowline visualization data from zones and wagons."""
-    zones = [ZoneInput(id=z.id, name=z.name, sequence=z.sequence) for z in req.zones]
-    wagons = [WagonCalcInput(
-        id=w.id, trade_id=w.trade_id, sequence=w.sequence,
-        duration_days=w.duration_days, buffer_after=w.buffer_after,
-    ) for w in req.wagons]
+    zones, wagons = _to_calc_inputs(req.zones, req.wagons)
 
     assignments = generate_takt_grid(zones, wagons, req.start_date, req.takt_time)
     flowline = compute_flowline_data(zones, wagons, assignments, req.takt_time)
@@ -197,7 +211,7 @@ try:
         start_date: date
         scenarios: list[dict] = Field(min_length=2)
 
-    @app.post("/simulate/what-if")
+    @router.post("/simulate/what-if")
     def run_what_if(req: WhatIfRequest):
         """Run a what-if simulation scenario."""
         zones_data = [{"id": z.id, "name": z.name, "sequence": z.sequence} for z in req.zones]
@@ -207,7 +221,7 @@ try:
         result = simulate_what_if(zones_data, wagons_data, req.takt_time, req.start_date, changes_data)
         return {"data": result, "error": None}
 
-    @app.post("/simulate/monte-carlo")
+    @router.post("/simulate/monte-carlo")
     def run_monte_carlo(req: MonteCarloRequest):
         """Run Monte Carlo simulation."""
         zones_data = [{"id": z.id, "name": z.name, "sequence": z.sequence} for z in req.zones]
@@ -220,7 +234,7 @@ try:
         )
         return {"data": result, "error": None}
 
-    @app.post("/simulate/compare")
+    @router.post("/simulate/compare")
     def run_compare(req: CompareRequest):
         """Compare multiple what-if scenarios."""
         zones_data = [{"id": z.id, "name": z.name, "sequence": z.sequence} for z in req.zones]
@@ -235,6 +249,9 @@ except ImportError as e:
     logger.warning(f"Simulation module not available: {e}. Simulation endpoints disabled.")
 
 
+app.include_router(router)
+
+
 if __name__ == "__main__":
     import os
     import uvicorn